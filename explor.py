@@ -17,22 +17,64 @@ __maintainer__ = "Talon24"
 __url__ = "https://github.com/Talon24/explore"
 __status__ = "Development"
 
-__all__ = ["explore", "explore_object", "explore_signature"]
+__all__ = ["explore", "explore_object", "explore_signature", "explore_many", "explore_package", "explore_tree",
+           "explore_diff", "explore_pages", "render", "aexplore", "ainspect_object", "ainspect_signature",
+           "inspect_object", "inspect_signature", "inspect_diff", "settings", "profile", "find", "Profile",
+           "ObjectCache", "ModuleIndex", "MemberIndex", "ObjectInfo", "SignatureInfo", "DiffInfo", "PackageReport",
+           "TreeNode", "TablePager"]
 
-import copy
-import pydoc
-import shutil
-import typing
-import inspect
+import io
+import os
+import sys
+import time
+import builtins
 import itertools
+import contextvars
 import collections
 
-import colorama
-import terminaltables
 
-colorama.init()
-TABLETYPE = terminaltables.DoubleTable
+class _LazyModule:  # pylint: disable=too-few-public-methods
+    """Placeholder for a module that is imported on first attribute access.
+
+    The module then replaces the placeholder in the globals of explor.
+    """
+
+    def __init__(self, name, alias=None):
+        self._name = name
+        self._alias = alias or name
+
+    def __getattr__(self, attribute):
+        module = __import__(self._name, fromlist=["__name__"])
+        globals()[self._alias] = module
+        return getattr(module, attribute)
+
+
+# These take most of the import time, but are only needed once something is explored.
+re = _LazyModule("re")
+json = _LazyModule("json")
+asyncio = _LazyModule("asyncio")
+pydoc = _LazyModule("pydoc")
+pkgutil = _LazyModule("pkgutil")
+importlib = _LazyModule("importlib")
+futures = _LazyModule("concurrent.futures", "futures")
+shutil = _LazyModule("shutil")
+typing = _LazyModule("typing")
+inspect = _LazyModule("inspect")
+types = _LazyModule("types")
+threading = _LazyModule("threading")
+weakref = _LazyModule("weakref")
+colorama = _LazyModule("colorama")
+terminaltables = _LazyModule("terminaltables")
+
+# TABLETYPE defaults to terminaltables.DoubleTable, see __getattr__
 COLORIZE = True
+# "terminaltables" or "fast", see _write_table
+RENDERER = "terminaltables"
+# Settings of the current thread or task that replace the globals above, see settings()
+_SETTINGS = contextvars.ContextVar("explor_settings", default=None)
+# Profile of the current thread or task, see profile()
+_PROFILE = contextvars.ContextVar("explor_profile", default=None)
+_INITIALIZED = False
 
 # _MAPPING = pkg_resources.resource_string("explore", "mapping.json")
 # Isn't created in a subdirectory without more than one module.
@@ -92,61 +134,454 @@ _MAPPING = {
 }
 
 
+_Attribute = collections.namedtuple("_Attribute", ["name", "typename", "category", "error", "elapsed"],
+                                    defaults=(None,))
+
+# Type name of attributes that were skipped because they took too long
+UNEVALUATED = "slow/unevaluated"
+# Type name of attributes that are only provided by __getattr__, used in static mode
+UNRESOLVED = "lazy/unresolved"
+
+
+# The category of a value only depends on its type, so it is looked up once per type.
+# Types of proxies that override __class__ are stored as None, their category depends on the target.
+_VALUE_CATEGORIES = {}
+
+
+def _categorize(item, value):
+    """Find the column an attribute belongs to."""
+    if item.startswith("__") and item.endswith("__"):
+        return "Dunders"
+    if item.startswith("_"):
+        return "Secrets"
+    if item.isupper():
+        return "Constants"
+    value_type = type(value)
+    category = _VALUE_CATEGORIES.get(value_type)
+    if category is not None:
+        return category
+    if inspect.ismodule(value):
+        category = "Modules"
+    elif inspect.ismethod(value):
+        category = "Methods"
+    elif inspect.isfunction(value) or value_type.__name__ == "cython_function_or_method":
+        category = "Functions"
+    elif inspect.isclass(value):
+        category = "Classes"
+    else:
+        category = "Data"
+    if len(_VALUE_CATEGORIES) > 4096:
+        _VALUE_CATEGORIES.clear()
+    _VALUE_CATEGORIES[value_type] = category if _plain_class(value_type) else None
+    return category
+
+
+def _plain_class(value_type):
+    """Check if the instances of value_type report it as their __class__, unlike proxies."""
+    for cls in type.__dict__["__mro__"].__get__(value_type):
+        if "__class__" in cls.__dict__:
+            return cls is object
+    return True
+
+
+# Descriptors whose value is the same kind of object for every instance, getting it runs no Python code
+_SHARED_DESCRIPTORS = (staticmethod, classmethod, type(_categorize), type(len), type(str.upper), type(str.__add__),
+                       type(dict.__dict__["fromkeys"]))
+# Descriptors that are cheap to get, but whose value can differ between instances
+_CHEAP_DESCRIPTORS = _SHARED_DESCRIPTORS + (type(type.__dict__["__name__"]), type(complex.real))
+
+
+class _Unevaluated(Exception):
+    """An attribute took longer than the time budget."""
+
+
+def _is_static(thing, item):
+    """Check if reading the attribute can't run arbitrary code.
+
+    That is the case for plain values and functions, but not for properties,
+    other descriptors and attributes provided by __getattr__.
+    """
+    if type(thing).__getattribute__ not in (object.__getattribute__, type.__getattribute__,
+                                             type(sys).__getattribute__):
+        return False
+    try:
+        value = inspect.getattr_static(thing, item)
+    except AttributeError:
+        return False
+    return isinstance(value, _CHEAP_DESCRIPTORS) or not hasattr(type(value), "__get__")
+
+
+def _guarded_getattr(thing, item, budget):
+    """Get an attribute in a separate thread and give up after budget seconds.
+
+    The thread can't be stopped, it is left running in the background.
+    It runs in a copy of the caller's context, so properties see the same
+    context variables, but threading.local values of the caller are not
+    visible to it.
+    """
+    result = []
+
+    def resolve():
+        try:
+            result.append((getattr(thing, item), None))
+        except BaseException as ex:  # pylint: disable=broad-except
+            result.append((None, ex))
+
+    context = contextvars.copy_context()
+    worker = threading.Thread(target=context.run, args=(resolve,), name="explor: {}".format(item), daemon=True)
+    worker.start()
+    worker.join(budget)
+    if not result:
+        raise _Unevaluated(item)
+    value, error = result[0]
+    if error is not None:
+        raise error
+    return value
+
+
+def _static_attribute(thing, item):
+    """Classify an attribute by what is stored in the namespaces, without evaluating it.
+
+    Properties and other descriptors are shown with the type of the
+    descriptor, functions stored on the class of an instance are methods.
+    """
+    try:
+        value = inspect.getattr_static(thing, item)
+    except AttributeError:
+        return _Attribute(item, UNRESOLVED, _categorize(item, None), None)
+    if isinstance(value, staticmethod):
+        value = value.__func__
+    elif isinstance(value, classmethod):
+        category = _categorize(item, None)
+        return _Attribute(item, "method", "Methods" if category == "Data" else category, None)
+    category = _categorize(item, value)
+    if category == "Functions" and not issubclass(type(thing), (type, type(sys))):
+        try:
+            instance_members = object.__getattribute__(thing, "__dict__")
+        except AttributeError:
+            instance_members = {}
+        if item not in instance_members:
+            return _Attribute(item, "method", "Methods", None)
+    return _Attribute(item, type(value).__name__, category, None)
+
+
+def _snapshot(thing, items, cached=None, own=(), budget=None, static=False):
+    """Resolve every attribute of thing exactly once.
+
+    Every later stage reads the type name and the category from the snapshot,
+    so expensive properties and lazy descriptors are only evaluated once.
+    Attributes of a cached snapshot of the same type are reused, unless they
+    are data or in own, the members set on the instance itself.
+    With a budget, the access time of every attribute is recorded, and
+    properties and other dynamic attributes that take longer than budget
+    seconds are marked as UNEVALUATED instead. If static is True, dynamic
+    attributes are not evaluated at all, see _static_attribute.
+    """
+    attributes = {}
+    current = _PROFILE.get()
+    if current is not None:
+        owner = type(thing).__name__
+        if not static and isinstance(thing, (type, type(sys))):
+            owner = getattr(thing, "__name__", owner)
+    for item in sorted(set(items)):
+        if cached:
+            attribute = cached.get(item)
+            if (attribute is not None and attribute.category not in (None, "Data") and item not in own
+                    and attribute.typename not in (UNEVALUATED, UNRESOLVED)):
+                attributes[item] = attribute
+                continue
+        if static and not _is_static(thing, item):
+            attributes[item] = _static_attribute(thing, item)
+            continue
+        start = time.perf_counter()
+        try:
+            if budget is None or static or _is_static(thing, item):
+                value = getattr(thing, item)
+            else:
+                value = _guarded_getattr(thing, item, budget)
+        except _Unevaluated:
+            attributes[item] = _Attribute(item, UNEVALUATED, _categorize(item, None), None,
+                                          time.perf_counter() - start)
+        except Exception as ex:  # pylint: disable=broad-except
+            attributes[item] = _Attribute(item, None, None, ex)
+        else:
+            elapsed = time.perf_counter() - start if budget is not None else None
+            attributes[item] = _Attribute(item, type(value).__name__, _categorize(item, value), None, elapsed)
+        if current is not None:
+            current.attributes.append((time.perf_counter() - start, owner, item))
+    return attributes
+
+
+def _classify(attributes):
+    """Sort the names of the attributes into the columns of their categories.
+
+    The snapshot is sorted by name, so the columns are sorted as well.
+    """
+    columns = collections.defaultdict(list)
+    for attribute in attributes:
+        columns[attribute.category].append(attribute.name)
+    return columns
+
+
+def _static_names(thing):
+    """Return the names that dir(thing) lists, without running the __dir__ of proxies.
+
+    The names are collected from the namespaces of the object and its
+    classes. Only modules are asked for their __dir__, which lazy-loading
+    modules use to list the submodules they haven't loaded yet.
+    """
+    if issubclass(type(thing), type(sys)):
+        return dir(thing)
+    if issubclass(type(thing), type):
+        classes = type.__dict__["__mro__"].__get__(thing)
+    else:
+        classes = type(thing).__mro__
+    try:
+        names = set(object.__getattribute__(thing, "__dict__"))
+    except (AttributeError, TypeError):
+        names = set()
+    for cls in classes:
+        names.update(vars(cls))
+    return sorted(names)
+
+
+def _shared_attribute(owner, item):
+    """Check if an attribute is classified the same for all instances of owner.
+
+    That is the case for plain class attributes, functions and builtin
+    methods, but not for properties and other descriptors.
+    """
+    try:
+        value = inspect.getattr_static(owner, item)
+    except AttributeError:
+        return False
+    return isinstance(value, _SHARED_DESCRIPTORS) or not hasattr(type(value), "__get__")
+
+
+def _own_members(thing):
+    """Return the members that are stored on the object itself."""
+    try:
+        return vars(thing)
+    except TypeError:
+        return {}
+
+
+def _shared_docstring(thing):
+    """Check if the docstring of an instance is the one of its type.
+
+    Functions, properties and other objects that store their own docstring
+    have a __doc__ descriptor on their type instead of a string.
+    """
+    if "__doc__" in _own_members(thing):
+        return False
+    try:
+        doc = inspect.getattr_static(type(thing), "__doc__")
+    except AttributeError:
+        return True
+    return doc is None or isinstance(doc, str)
+
+
+def _has_default_dir(thing):
+    """Check if dir(thing) is the members of the instance and its type."""
+    return type(thing).__dir__ is object.__dir__ and thing.__class__ is type(thing)
+
+
+_CacheEntry = collections.namedtuple(
+    "_CacheEntry", ["attributes", "complete", "names", "extras_all", "parents", "description"])
+
+
+def _namespace_version(owner):
+    """Fingerprint the namespace of a module or class.
+
+    Python doesn't expose the version of a dict, so the names and the
+    identities of their values are hashed instead.
+    """
+    namespaces = [owner] if inspect.ismodule(owner) else inspect.getmro(owner)
+    try:
+        return hash(tuple((name, id(value))
+                          for namespace in namespaces
+                          for name, value in vars(namespace).items()))
+    except TypeError:
+        return None
+
+
+class ObjectCache:
+    """LRU cache for the type-level part of explored objects.
+
+    Modules and classes are keyed by themselves, instances by their type.
+    The key also contains a fingerprint of the namespace, so modified
+    modules and classes are classified again, unless versioned is False.
+    For instances, only the data and the attributes set on the instance are
+    resolved again.
+    """
+
+    def __init__(self, maxsize=128, versioned=True):
+        self.maxsize = maxsize
+        self.versioned = versioned
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._operators = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, thing):
+        """Return the cache key of thing, or None if it can't be cached."""
+        owner = thing if inspect.ismodule(thing) or inspect.isclass(thing) else type(thing)
+        try:
+            hash(owner)
+        except TypeError:
+            return None
+        if not self.versioned:
+            return (owner is thing, owner, None)
+        version = _namespace_version(owner)
+        if version is None:
+            return None
+        return (owner is thing, owner, version)
+
+    def get(self, key):
+        """Return the entry for key and mark it as recently used."""
+        try:
+            entry = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """Store an entry and evict the least recently used ones."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, thing):
+        """Remove all entries that belong to a module, class or the type of an instance."""
+        owner = thing if inspect.ismodule(thing) or inspect.isclass(thing) else type(thing)
+        for key in [key for key in self._entries if key[1] is owner]:
+            del self._entries[key]
+
+    def map_dunders(self, items, hashable):
+        """Memoized version of ObjectProperties._map_dunders for objects with the same dunders.
+
+        Like the entries, at most maxsize sets of dunders are kept.
+        """
+        key = (tuple(items), hashable)
+        try:
+            ops, remaining = self._operators[key]
+            self._operators.move_to_end(key)
+        except KeyError:
+            remaining = list(items)
+            ops = sorted(ObjectProperties._map_dunders(remaining, hashable))  # pylint: disable=protected-access
+            self._operators[key] = ops, remaining
+            while self.maxsize is not None and len(self._operators) > self.maxsize:
+                self._operators.popitem(last=False)
+        items[:] = remaining
+        return list(ops)
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self._operators.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+OBJECT_CACHE = ObjectCache()
+
+
 class ObjectProperties:
     """Class to store the properties of an object."""
 
-    def __init__(self, thing):
-        items = set(dir(thing))
+    def __init__(self, thing, cache=None, budget=None, static=False):
+        self.thing = thing
+        self.static = static
+        if static:
+            # A cached classification may have evaluated the descriptors, and vice versa
+            cache = None
+        key = cache.key(thing) if cache is not None else None
+        entry = cache.get(key) if key is not None else None
+        if entry is not None and entry.complete:
+            self._attributes = entry.attributes
+        elif entry is not None:
+            # dir() of an instance is the same as for other instances, except for its own members.
+            own = _own_members(thing)
+            items = entry.names.union(own) if entry.names is not None else _timed("dir", dir, thing)
+            self._attributes = _timed("access", _snapshot, thing, items, entry.attributes, own, budget=budget)
+        else:
+            items = _timed("dir", _static_names if static else dir, thing)
+            self._attributes = _timed("access", _snapshot, thing, items, budget=budget, static=static)
 
+        if entry is not None:
+            self.extras_all = list(entry.extras_all)
         # Check for __all__ members that are not in dir()
-        if inspect.ismodule(thing) and hasattr(thing, "__all__"):
-            extras = set(thing.__all__).difference(items)
+        elif static and issubclass(type(thing), type(sys)):
+            extras = set(inspect.getattr_static(thing, "__all__", ())).difference(self._attributes)
+            self.extras_all = sorted(extras)
+        elif not static and inspect.ismodule(thing) and hasattr(thing, "__all__"):
+            extras = set(thing.__all__).difference(self._attributes)
             self.extras_all = sorted(extras)
         else:
             self.extras_all = []
         # Check if item is reachable
-        for item in sorted(items):
-            try:
-                getattr(thing, item)
-            except Exception as ex:  # pylint: disable=broad-except
-                items.remove(item)
-                print(colored("Couldn't access property {} of {!r} because {}".format(item, thing, ex),
-                              colorama.Fore.LIGHTRED_EX))
-        items = _apply_custom_filters(items, thing)
-
-        self.thing = thing
-        self.dunders = sorted([item for item in items if item.startswith("__") and item.endswith("__")])
-        items.difference_update(self.dunders)
-        self.secrets = sorted([item for item in items if item.startswith("_")])
-        items.difference_update(self.secrets)
-        self.constants = sorted([item for item in items if item.isupper()])
-        items.difference_update(self.constants)
-        self.modules = sorted([item for item in items if inspect.ismodule(getattr(thing, item))])
-        items.difference_update(self.modules)
-        self.methods = sorted([item for item in items if inspect.ismethod(getattr(thing, item))])
-        items.difference_update(self.methods)
-        self.functions = sorted([
-            item for item in items
-            if (inspect.isfunction(getattr(thing, item))
-                or type(getattr(thing, item)).__name__ == "cython_function_or_method")])
-        items.difference_update(self.functions)
-        self.classes = sorted([item for item in items if inspect.isclass(getattr(thing, item))])
-        items.difference_update(self.classes)
-        self.data = list(items)
-        self.prune_data()
-        self.ops = sorted(self._map_dunders(thing, self.dunders))
-        self.parents = self.parent_order(thing)
-        self.description = docstring_head(thing)
+        self.warnings = ["Couldn't access property {} of {!r} because {}".format(attribute.name, thing, attribute.error)
+                         for attribute in self._attributes.values() if attribute.error is not None]
+        attributes = _timed("filters", _apply_custom_filters, self._attributes.values(), thing)
+        columns = _timed("classify", _classify, attributes)
+        self.dunders = columns["Dunders"]
+        self.secrets = columns["Secrets"]
+        self.constants = columns["Constants"]
+        self.modules = columns["Modules"]
+        self.methods = columns["Methods"]
+        self.functions = columns["Functions"]
+        self.classes = columns["Classes"]
+        self.data = columns["Data"]
+        _timed("prune_data", self.prune_data)
+        hashable = "__hash__" in self._attributes and self._attributes["__hash__"].typename != "NoneType"
+        if cache is not None:
+            self.ops = _timed("map_dunders", cache.map_dunders, self.dunders, hashable)
+        else:
+            self.ops = sorted(_timed("map_dunders", self._map_dunders, self.dunders, hashable))
+        if entry is not None:
+            self.parents = entry.parents
+            if entry.complete or _shared_docstring(thing):
+                self.description = entry.description
+            else:
+                self.description = _timed("docstring_head", docstring_head, thing)
+        elif static:
+            # Proxies may load their target on any access to __class__, __mro__ or __doc__
+            self.parents = _timed("parent_order", self.parent_order,
+                                  thing if issubclass(type(thing), type) else type(thing))
+            self.description = _timed("docstring_head", docstring_head, thing, static=True)
+        else:
+            self.parents = _timed("parent_order", self.parent_order, thing)
+            self.description = _timed("docstring_head", docstring_head, thing)
+            # Like the module index, keep results that are cut short by the budget out of the cache
+            unevaluated = any(attribute.typename == UNEVALUATED for attribute in self._attributes.values())
+            if key is not None and not unevaluated:
+                names = None
+                if not key[0] and _has_default_dir(thing):
+                    names = frozenset(self._attributes).difference(_own_members(thing))
+                attributes = self._attributes
+                if not key[0]:
+                    # Properties and other descriptors can differ between instances of the type
+                    attributes = {name: attribute for name, attribute in attributes.items()
+                                  if _shared_attribute(type(thing), name)}
+                cache.put(key, _CacheEntry(attributes, key[0], names, tuple(self.extras_all),
+                                           self.parents, self.description))
 
     def prune_data(self):
         """Move items out of the Data row."""
         remappable = ("method_descriptor", "builtin_function_or_method")
         uninteresting = ("PytestTester", "_Feature")
         for item in self.data[:]:
-            typename = type(getattr(self.thing, item)).__name__
+            typename = self._attributes[item].typename
             if typename in remappable or typename in uninteresting:
                 if typename in remappable:
-                    if inspect.ismodule(self.thing):
+                    if issubclass(type(self.thing), type(sys)) if self.static else inspect.ismodule(self.thing):
                         self.functions.append(item)
                     else:
                         self.methods.append(item)
@@ -155,11 +590,17 @@ class ObjectProperties:
         self.functions.sort()
         self.methods.sort()
 
+    @property
+    def timings(self):
+        """Return the access time of the attributes in seconds, if it was recorded."""
+        return {attribute.name: attribute.elapsed for attribute in self._attributes.values()
+                if attribute.elapsed is not None}
+
     def color_operators(self):
         self.ops = [colored(text, colorama.Fore.LIGHTGREEN_EX) for text in self.ops]
 
     @staticmethod
-    def _map_dunders(thing, items):
+    def _map_dunders(items, hashable):
         """Match dunder methods to the operator/construct they are related to."""
         ops = []
         for item in items[:]:
@@ -170,7 +611,7 @@ class ObjectProperties:
         # Special case: Hash. Classes can have hashes, but not their instances,
         # or hash might be None.
         # list has a __hash__ - attr (None), even though it is not hashable
-        if "__hash__" in items and thing.__hash__:
+        if "__hash__" in items and hashable:
             ops.append("hash")
         return ops
 
@@ -206,9 +647,92 @@ class ObjectProperties:
 
     def color_types(self):
         """Color the types for better readability."""
-        self.data = [
-            "{}: {}".format(item, colored(type(getattr(self.thing, item)).__name__, colorama.Fore.LIGHTCYAN_EX))
-            for item in self.data]
+        self.data = [_data_cell(item, self._attributes[item].typename, colorama.Fore.LIGHTCYAN_EX)
+                     for item in self.data]
+
+
+# Ids of the builtins without signature that are documented in the library reference,
+# builtins are never collected, so the ids stay valid. 3.5 doesn't know breakpoint.
+_DOCUMENTED_BUILTINS = {id(vars(builtins)[name]): name for name in (
+    "__import__", "breakpoint", "dir", "getattr", "iter", "max", "min", "next", "print", "vars")
+                        if name in vars(builtins)}
+# Parsed signatures by callable, created on first use, see _parse_signature
+_SIGNATURES = None
+# Parsed signatures of callables that can't be referenced weakly, like the methods
+# of builtin types, by id. They are kept alive, so that the ids stay valid.
+_PINNED_SIGNATURES = {}
+
+
+class _ParsedSignature:  # pylint: disable=too-few-public-methods
+    """Signature of a callable, with the rows and the docstring head derived from it.
+
+    signature is None if the callable doesn't reveal its signature. The rows
+    are stored by show_hidden, the description once it is needed.
+    """
+
+    __slots__ = ("version", "signature", "rows", "description")
+
+    def __init__(self, version, signature):
+        self.version = version
+        self.signature = signature
+        self.rows = {}
+        self.description = None
+
+
+def _signature_version(thing):
+    """Return the attributes that the signature and the docstring of a callable are read from."""
+    overrides = (getattr(thing, "__signature__", None), getattr(thing, "__wrapped__", None))
+    if isinstance(thing, type):
+        return (type(thing).__call__, thing.__new__, thing.__init__, thing.__doc__) + overrides
+    annotations = getattr(thing, "__annotations__", None)
+    # The annotations can be changed in place, so compare a copy
+    annotations = dict(annotations) if isinstance(annotations, dict) else annotations
+    return (getattr(thing, "__code__", None), getattr(thing, "__defaults__", None),
+            getattr(thing, "__kwdefaults__", None), getattr(thing, "__doc__", None),
+            annotations) + overrides
+
+
+def _parse_signature(thing):
+    """Return the _ParsedSignature of a callable.
+
+    It is stored weakly by the callable and parsed again if the callable was
+    modified. Bound methods share it with other methods of the same function.
+    Callables that are not hashable are parsed on every call.
+    """
+    global _SIGNATURES  # pylint: disable=global-statement
+    if _SIGNATURES is None:
+        _SIGNATURES = weakref.WeakKeyDictionary()
+    bound = inspect.ismethod(thing)
+    key = thing.__func__ if bound else thing
+    version = _signature_version(key)
+    try:
+        entries = _SIGNATURES.get(key)
+        weak = True
+    except TypeError:
+        entries = _PINNED_SIGNATURES.get(id(key), (None, None))[1]
+        weak = False
+    parsed = entries.get(bound) if entries is not None else None
+    if parsed is not None and parsed.version == version:
+        return parsed
+    try:
+        signature = inspect.signature(thing)
+    except ValueError:
+        signature = None
+    parsed = _ParsedSignature(version, signature)
+    if entries is None:
+        entries = {}
+        if weak:
+            _SIGNATURES[key] = entries
+        else:
+            try:
+                hash(key)
+            except TypeError:
+                return parsed
+            if len(_PINNED_SIGNATURES) > 4096:
+                _PINNED_SIGNATURES.clear()
+            _PINNED_SIGNATURES[id(key)] = (key, entries)
+    entries[bound] = parsed
+    return parsed
 
 
 class SignatureProperties:
@@ -217,21 +741,15 @@ class SignatureProperties:
     def __init__(self, thing, show_hidden: bool):
         self.thing = thing
         self.error = None
-        try:
-            self.signature = inspect.signature(thing)
-        except ValueError:
-            self.error = colored("{!r} does not reveal its signature.".format(thing), colorama.Fore.RED)
-            try:
-                standard_builtins = (__import__, breakpoint, dir, getattr, iter,
-                                     max, min, next, print, vars)
-            except NameError:  # 3.5 doesn't know breakpoint
-                standard_builtins = (__import__, dir, getattr, iter,
-                                     max, min, next, print, vars)
-            if thing in standard_builtins:
-                self.error += "\n" + colored("Check the documentation at "
-                                             "https://docs.python.org/3/library/functions.html#{}"
-                                             " .".format(thing.__name__), colorama.Fore.RED)
+        self._parsed = _timed("signature", _parse_signature, thing)
+        if self._parsed.signature is None:
+            self.error = "{!r} does not reveal its signature.".format(thing)
+            self.documentation = None
+            name = _DOCUMENTED_BUILTINS.get(id(thing))
+            if name is not None:
+                self.documentation = "https://docs.python.org/3/library/functions.html#{}".format(name)
             return
+        self.signature = self._parsed.signature
         self.parameters = self.signature.parameters
         self.return_type = self.signature.return_annotation
         self.header = ["Argument", "Default", "Type", "Kind"]
@@ -239,26 +757,29 @@ class SignatureProperties:
         self._extract_arguments(show_hidden)
 
     def _extract_arguments(self, show_hidden):
-        """Extract the arguments from the signature."""
-        for name, parameter in self.parameters.items():
-            kind = parameter.kind.description
-            default = parameter.default
-            default = repr(default) if default is not inspect.Signature.empty else "---"
-            annotation = self._simplify_annotation(parameter.annotation, show_hidden)
-            self.data.append([name, default, annotation, kind])
+        """Extract the arguments from the signature, or copy them from an earlier call."""
+        rows = self._parsed.rows.get(show_hidden)
+        if rows is None:
+            rows = []
+            for name, parameter in self.parameters.items():
+                kind = parameter.kind.description
+                default = parameter.default
+                default = repr(default) if default is not inspect.Signature.empty else "---"
+                annotation = self._simplify_annotation(parameter.annotation, show_hidden)
+                rows.append((name, default, annotation, kind))
+            rows = self._parsed.rows[show_hidden] = tuple(rows)
+        self.data = [list(row) for row in rows]
+
+    @property
+    def description(self):
+        """Return the head of the docstring, it is only extracted once per callable."""
+        if self._parsed.description is None:
+            self._parsed.description = _timed("docstring_head", docstring_head, self.thing)
+        return self._parsed.description
 
     def prune_arguments(self):
         """Remove default information from list of arguments if all are unset."""
-        type_index = self.header.index("Type")
-        if all(entry[type_index] == "Any" for entry in self.data):
-            for entry in self.data:
-                del entry[type_index]
-            del self.header[type_index]
-        kind_index = self.header.index("Kind")
-        if all(entry[kind_index].lower() == "Positional Or Keyword".lower() for entry in self.data):
-            for entry in self.data:
-                del entry[kind_index]
-            del self.header[kind_index]
+        _prune_arguments(self.header, self.data)
 
     @property
     def dict(self):
@@ -300,101 +821,710 @@ class SignatureProperties:
                 row[0] = colored(row[0], colorama.Fore.RED)
 
 
-def _print_signature_result(thing, data, return_type, table):
-    """Write the analysis result back."""
-    if not inspect.isclass(thing):
-        table.title = " Function {} ".format(thing.__name__)
-        if isinstance(return_type, str):
-            table.title += "-> {} ".format(return_type)
-        elif return_type is not inspect.Signature.empty:
-            table.title += "-> {} ".format(return_type.__name__)
-    else:
-        table.title = " Constructor "
-    description = docstring_head(thing)
-    if description:
-        print("  Description:\n{}".format(description))
-    if data:
-        print(table.table)
-    else:
-        print("This Function takes no arguments.")
+def _prune_arguments(header, data):
+    """Remove default information from list of arguments if all are unset."""
+    type_index = header.index("Type")
+    if all(entry[type_index] == "Any" for entry in data):
+        for entry in data:
+            del entry[type_index]
+        del header[type_index]
+    kind_index = header.index("Kind")
+    if all(entry[kind_index].lower() == "Positional Or Keyword".lower() for entry in data):
+        for entry in data:
+            del entry[kind_index]
+        del header[kind_index]
+
+
+class _Result:
+    """Base class for the frozen results of inspect_object and inspect_signature.
+
+    Subclasses list their public fields in _fields.
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, **fields):
+        for name in self._fields:
+            object.__setattr__(self, name, fields.pop(name))
+        if fields:
+            raise TypeError("Unexpected fields {}".format(", ".join(fields)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):  # pylint: disable=unidiomatic-typecheck
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self._fields))
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, ", ".join(
+            "{}={!r}".format(name, getattr(self, name)) for name in self._fields))
+
+    def __reduce__(self):
+        return (_rebuild_result, (type(self), tuple(getattr(self, name) for name in self._fields)))
+
+
+def _rebuild_result(cls, values):
+    """Unpickle a result."""
+    return cls(**dict(zip(cls._fields, values)))
+
 
+# Strings and tuples shared by ObjectInfo results, see _intern and _share
+_INTERNED = {}
 
-def _make_table(data, thing):
+
+def _intern(value):
+    """Return a shared copy of a name or a tuple of names.
+
+    Results of objects of the same type mostly hold the same names, so
+    they are only kept in memory once.
+    """
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return sys.intern(value)
+    if type(value) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return _share(tuple(_intern(item) for item in value))
+    return value
+
+
+def _share(value):
+    """Return a shared copy of a text or a tuple.
+
+    Unlike sys.intern, which keeps the strings for the rest of the program
+    on newer versions of Python, the table is cleared when it grows too big.
+    """
+    if len(_INTERNED) > 4096:
+        _INTERNED.clear()
+    return _INTERNED.setdefault(value, value)
+
+
+class ObjectInfo(_Result):
+    """Classified members of an object, as returned by inspect_object.
+
+    All member lists are sorted tuples of names, data_types holds the type
+    names of the data members in the same order. unevaluated lists the
+    attributes that exceeded the time budget or could not be resolved
+    statically.
+    The names and tuples are shared with other results, see _intern, and
+    the explored object is only referenced weakly by subject.
+    """
+
+    _fields = ("typename", "name", "dunders", "secrets", "constants", "modules", "methods", "functions",
+               "classes", "data", "data_types", "ops", "extras", "parents", "description", "warnings",
+               "unevaluated")
+    __slots__ = _fields + ("_subject",)
+
+    # Free text is shared, but not interned, warnings contain addresses and are not shared at all
+    _texts = ("parents", "description")
+
+    def __init__(self, subject=None, **fields):
+        super().__init__(**{name: value if name == "warnings" else
+                            _share(value) if name in self._texts else _intern(value)
+                            for name, value in fields.items()})
+        try:
+            reference = weakref.ref(subject) if subject is not None else None
+        except TypeError:
+            reference = None
+        object.__setattr__(self, "_subject", reference)
+
+    @property
+    def subject(self):
+        """Return the explored object, or None if it is gone or can't be referenced weakly."""
+        return self._subject() if self._subject is not None else None
+
+    @classmethod
+    def from_properties(cls, properties):
+        """Freeze the content of ObjectProperties."""
+        thing = properties.thing
+        attributes = properties._attributes  # pylint: disable=protected-access
+        name = None
+        if not properties.static or _is_static(thing, "__name__"):
+            name = getattr(thing, "__name__", None)
+        return cls(
+            subject=thing,
+            typename=type(thing).__name__,
+            name=name,
+            dunders=tuple(properties.dunders),
+            secrets=tuple(properties.secrets),
+            constants=tuple(properties.constants),
+            modules=tuple(properties.modules),
+            methods=tuple(properties.methods),
+            functions=tuple(properties.functions),
+            classes=tuple(properties.classes),
+            data=tuple(properties.data),
+            data_types=tuple(attributes[item].typename for item in properties.data),
+            ops=tuple(properties.ops),
+            extras=tuple(properties.extras_all),
+            parents=properties.parents,
+            description=properties.description,
+            warnings=tuple(properties.warnings),
+            unevaluated=tuple(attribute.name for attribute in attributes.values()
+                              if attribute.typename in (UNEVALUATED, UNRESOLVED)),
+        )
+
+    @property
+    def dict(self):
+        """Return the members as a dictionary of the table columns."""
+        return {
+            "Dunders": self.dunders,
+            "Secrets": self.secrets,
+            "Constants": self.constants,
+            "Modules": self.modules,
+            "Methods": self.methods,
+            "Functions": self.functions,
+            "Classes": self.classes,
+            "Data": self.data,
+            "Ops": self.ops,
+            "Extras": self.extras,
+        }
+
+    @property
+    def title(self):
+        """Infer the title of the table from the object type."""
+        if self.name is None:
+            return " Class {} ".format(self.typename)
+        return " {}: {} ".format(self.typename, self.name)
+
+
+class SignatureInfo(_Result):
+    """Parameters of a callable, as returned by inspect_signature.
+
+    If the signature can't be read, error holds the reason and documentation
+    possibly a link to the documentation of a builtin.
+    """
+
+    __slots__ = ("name", "is_class", "header", "arguments", "return_type", "description",
+                 "error", "documentation")
+    _fields = __slots__
+
+    @classmethod
+    def from_properties(cls, properties):
+        """Freeze the content of SignatureProperties."""
+        thing = properties.thing
+        is_class = inspect.isclass(thing)
+        if properties.error:
+            return cls(name=getattr(thing, "__name__", None), is_class=is_class, header=(), arguments=(),
+                       return_type=None, description=None, error=properties.error,
+                       documentation=properties.documentation)
+        return_type = properties.return_type
+        if is_class or return_type is inspect.Signature.empty:
+            return_type = None
+        elif not isinstance(return_type, str):
+            return_type = return_type.__name__
+        return cls(
+            name=thing.__name__,
+            is_class=is_class,
+            header=tuple(properties.header),
+            arguments=tuple(tuple(row) for row in properties.data),
+            return_type=return_type,
+            description=properties.description,
+            error=None,
+            documentation=None,
+        )
+
+    @property
+    def title(self):
+        """Infer the title of the table from the callable."""
+        if self.is_class:
+            return " Constructor "
+        title = " Function {} ".format(self.name)
+        if self.return_type is not None:
+            title += "-> {} ".format(self.return_type)
+        return title
+
+
+def _make_table(data, title):
     """Convert list-of-columns to list-of-rows."""
     with_header = [
-        [key] + value for key, value in data.items() if len(value) > 0]
+        [key] + list(value) for key, value in data.items() if len(value) > 0]
     rotated = list(itertools.zip_longest(*with_header, fillvalue=""))
-    table = TABLETYPE(rotated)
-    _set_table_title(thing, table)
+    table = _table_type()(rotated)
+    table.title = title
     return table
 
 
-def _fold_list(data, columns):
-    """Convert one column of data to <columns> columns, aligned."""
+class _LazyRows:
+    """Rows of a table that are only built while the table is written.
+
+    terminaltables only needs the number of rows and the rows themselves in
+    order, so the columns are not rotated in memory. Cells are cut to the
+    limit of their column, if there is one.
+    """
+
+    def __init__(self, columns, limits):
+        self.columns = columns
+        self.limits = limits
+        self.cut = any(limit is not None for limit in limits)
+
+    def __len__(self):
+        return 1 + max(len(cells) for _, cells in self.columns) if self.columns else 0
+
+    def __iter__(self):
+        if not self.columns:
+            return
+        yield self[0]
+        rows = itertools.zip_longest(*(cells for _, cells in self.columns), fillvalue="")
+        if not self.cut:
+            yield from rows
+            return
+        for row in rows:
+            yield tuple(_truncate(cell, limit) for cell, limit in zip(row, self.limits))
+
+    def __getitem__(self, index):
+        if index == 0:
+            return tuple(_truncate(header, limit) for (header, _), limit in zip(self.columns, self.limits))
+        if not self.cut:
+            return tuple(cells[index - 1] if index <= len(cells) else "" for _, cells in self.columns)
+        return tuple(_truncate(cells[index - 1], limit) if index <= len(cells) else ""
+                     for (_, cells), limit in zip(self.columns, self.limits))
+
+
+class _RowHeights:  # pylint: disable=too-few-public-methods
+    """Heights of the rows of _LazyRows, calculated like terminaltables does when they are needed."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __getitem__(self, index):
+        return max([cell.count("\n") + 1 for cell in self.rows[index] if cell] or [0])
+
+
+_ANSI_ESCAPE = r"(\x1b\[[0-9;]*m)"
+
+
+def _truncate(cell, limit):
+    """Cut a cell to limit visible characters, but keep its color codes."""
+    visible_width = terminaltables.width_and_alignment.visible_width
+    if limit is None or visible_width(cell) <= limit:
+        return cell
+    parts = []
+    remaining = limit - 1  # Leave space for the ellipsis
+    for index, part in enumerate(re.split(_ANSI_ESCAPE, cell)):
+        if index % 2:
+            # Color codes take no space
+            parts.append(part)
+        elif remaining is not None:
+            for char in part:
+                if visible_width(char) > remaining:
+                    parts.append("…")
+                    remaining = None
+                    break
+                parts.append(char)
+                remaining -= visible_width(char)
+    return "".join(parts)
+
+
+class _MultilineCell(Exception):
+    """The fast renderer only handles cells with a single line."""
+
+
+def _cell_width(cell):
+    """Measure the visible width of a cell like terminaltables, with a shortcut for ASCII."""
+    if cell.isascii():
+        if "\033" in cell:
+            return len(terminaltables.width_and_alignment.RE_COLOR_ANSI.sub("", cell))
+        return len(cell)
+    return terminaltables.width_and_alignment.visible_width(cell)
+
+
+class _Cell(str):
+    """A string that carries its visible width, so it is never measured again.
+
+    Operations on it return plain strings, which are measured when needed.
+    """
+
+    __slots__ = ("width",)
+
+    def __new__(cls, text, width=None):
+        cell = super().__new__(cls, text)
+        cell.width = _cell_width(text) if width is None else width
+        return cell
+
+
+def _display_width(text):
+    """Return the visible width of text, without color codes and with wide characters counting twice."""
+    if type(text) is _Cell:  # pylint: disable=unidiomatic-typecheck
+        return text.width
+    return _cell_width(text)
+
+
+def _fast_supported(table):
+    """Check if the fast renderer draws the table exactly like terminaltables does."""
+    base = terminaltables.base_table.BaseTable
+    markdown = terminaltables.GithubFlavoredMarkdownTable
+    return (not table.justify_columns and type(table).gen_row_lines is base.gen_row_lines
+            and type(table).gen_table in (base.gen_table, markdown.gen_table))
+
+
+def _fast_lines(table, inner_widths, outer_widths):
+    """Draw the lines of table.gen_table, with padding computed from the cell widths.
+
+    terminaltables pads and combines every cell with generators, here every
+    row is built with a single join. Only the borders are drawn by the table.
+    """
+    markdown = type(table).gen_table is terminaltables.GithubFlavoredMarkdownTable.gen_table
+    outer = table.outer_border and not markdown
+    left_pad, right_pad = " " * table.padding_left, " " * table.padding_right
+
+    def border(style):
+        return "".join(table.horizontal_border(style, outer_widths))
+
+    def verticals(prefix):
+        left, center, right = ("CHAR_{}OUTER_LEFT_VERTICAL".format(prefix), "CHAR_{}INNER_VERTICAL".format(prefix),
+                               "CHAR_{}OUTER_RIGHT_VERTICAL".format(prefix))
+        return (getattr(table, left) + left_pad if table.outer_border else left_pad,
+                right_pad + getattr(table, center) + left_pad if table.inner_column_border else right_pad + left_pad,
+                right_pad + getattr(table, right) if table.outer_border else right_pad)
+
+    styles = {"row": verticals(""), "heading": verticals("H_"), "footing": verticals("F_")}
+    heading = table.inner_heading_row_border and not markdown
+    footing = table.inner_footing_row_border and not markdown
+    last = len(table.table_data) - 1
+    lines = [border("top")] if outer else []
+    for index, row in enumerate(table.table_data):
+        cells = []
+        for cell, width in zip(row, inner_widths):
+            if "\n" in cell:
+                raise _MultilineCell()
+            cells.append(cell.ljust(width + len(cell) - _display_width(cell)))
+        cells.extend(" " * width for width in inner_widths[len(cells):])
+        style = "heading" if heading and index == 0 else "footing" if footing and index == last else "row"
+        left, center, right = styles[style]
+        lines.append(left + center.join(cells) + right)
+        if index == last:
+            break
+        if index == 0 and (heading or markdown):
+            lines.append(border(None if markdown else "heading"))
+        elif footing and index == last - 1:
+            lines.append(border("footing"))
+        elif table.inner_row_border and not markdown:
+            lines.append(border("row"))
+    if outer:
+        lines.append(border("bottom"))
+    return lines
+
+
+def _write_table(data, title, file, widths=None, cut=False, renderer=None):
+    """Write the table of _make_table(data, title) to file, line by line.
+
+    The lines are built and written one after the other, so the first
+    lines are written before the rest of the table is rendered. widths maps
+    headers to the width of their column without padding, other columns are
+    measured first. With cut=True, cells that are wider than their given
+    width are cut.
+    With the "fast" renderer, which defaults to RENDERER, the whole table is
+    built by explor and written at once. It looks the same, but falls back
+    to terminaltables for custom tables and cells with more than one line.
+    """
+    renderer = renderer or _setting("RENDERER")
+    if renderer not in ("terminaltables", "fast"):
+        raise ValueError("Unknown renderer {!r}, use 'terminaltables' or 'fast'".format(renderer))
+    widths = widths or {}
+    columns = [(key, value) for key, value in data.items() if len(value) > 0]
+    limits = [widths.get(key) if cut else None for key, _ in columns]
+    inner_widths = [
+        widths[key] if key in widths else
+        max(_display_width(line) for cell in itertools.chain([key], value)
+            for line in (cell.splitlines() if "\n" in cell else [cell]) or [""])
+        for key, value in columns]
+    table = _table_type()(_LazyRows(columns, limits))
+    table.title = title
+    padding = table.padding_left + table.padding_right
+    outer_widths = [width + padding for width in inner_widths]
+    unix = isinstance(table, terminaltables.other_tables.UnixTable)
+    if renderer == "fast" and _fast_supported(table):
+        try:
+            text = "\n".join(_fast_lines(table, inner_widths, outer_widths))
+        except _MultilineCell:
+            pass
+        else:
+            file.write((text.replace("\033(B\033(0", "") if unix else text) + "\n")
+            return
+    written = False
+    for line in table.gen_table(inner_widths, _RowHeights(table.table_data), outer_widths):
+        line = "".join(line)
+        if unix:
+            # Same as UnixTable.table, don't switch the character set back and forth
+            line = line.replace("\033(B\033(0", "")
+        file.write(line + "\n")
+        written = True
+    if not written:
+        file.write("\n")
+
+
+def _fold_list(data, columns, widths=None):
+    """Convert one column of data to <columns> columns, aligned by their visible width.
+
+    widths holds the visible widths of the cells, if they are known already.
+    """
+    if widths is None:
+        widths = _display_widths(data)
     rows, remainder = divmod(len(data), columns)
-    chunked = (data[col * rows + min(col, remainder):(col + 1) * rows + min(col + 1, remainder)]
-               for col in range(columns))
-    folded = [["{item:{length}}".format(item=cell, length=max(len(cell_) for cell_ in col))
-               for cell in col]
-              for col in chunked]
-    block = [" ".join(items) for items in itertools.zip_longest(*folded, fillvalue="")]
+    bounds = [col * rows + min(col, remainder) for col in range(columns + 1)]
+    folded = []
+    lengths = []
+    for start, stop in zip(bounds, bounds[1:]):
+        length = max(widths[start:stop], default=0)
+        spaces = [" " * gap for gap in range(length + 1)]
+        folded.append([cell + spaces[length - width] for cell, width in zip(data[start:stop], widths[start:stop])])
+        lengths.append(length)
+    # Every row has a cell of every column, except for the last one with the remainder
+    width = sum(lengths) + columns - 1
+    block = [_Cell(row, width) for row in map(" ".join, zip(*folded))]
+    if remainder:
+        last = [col[rows] for col in folded[:remainder]] + [""] * (columns - remainder)
+        block.append(_Cell(" ".join(last), sum(lengths[:remainder]) + columns - 1))
     return block
 
 
-def _minify_data(source_data, thing):
-    """Compress too long lists."""
+def _display_widths(cells):
+    """Measure the visible widths of many cells, all at once if they are plain ASCII."""
+    joined = "".join(cells)
+    if joined.isascii() and "\033" not in joined:
+        return list(map(len, cells))
+    return [_display_width(cell) for cell in cells]
+
+
+class _ColumnLayout:
+    """Cached string widths of one column to plan its folding without rendering."""
+
+    def __init__(self, header, cells):
+        self.widths = _display_widths(cells)
+        self.header_width = _display_width(header)
+        self.folds = 1
+        self.height = len(cells)
+        self.width = max([self.header_width] + self.widths)
+
+    def fold(self, columns):
+        """Calculate height and width of this column when folded into <columns> columns.
+
+        The widest row is one with a cell of every column, see _fold_list,
+        so only the widest cell of every column is needed.
+        """
+        rows, remainder = divmod(len(self.widths), columns)
+        bounds = [col * rows + min(col, remainder) for col in range(columns + 1)]
+        width = sum(max(self.widths[start:stop], default=0) for start, stop in zip(bounds, bounds[1:]))
+        return rows + (1 if remainder else 0), max(self.header_width, width + columns - 1)
+
+
+def _table_width(layouts):
+    """Calculate the width the table would have, including borders and padding."""
+    table = _table_type()([])
+    padding = table.padding_left + table.padding_right
+    outer_widths = [layout.width + padding for layout in layouts if layout.height]
+    return terminaltables.width_and_alignment.table_width(
+        outer_widths, 2 if table.outer_border else 0, 1 if table.inner_column_border else 0)
+
+
+def _minify_data(source_data):
+    """Compress too long lists.
+
+    The foldings are planned on the cached cell widths, only the final
+    foldings are applied to the data.
+    """
+    return _fold_data(source_data)[0]
+
+
+def _fold_data(source_data):
+    """Compress too long lists, and return the data with the widths of its columns."""
     term_size = shutil.get_terminal_size((80, 20))
-    data = copy.deepcopy(source_data)
-    # The candidate is the longest column
-    candidate_key, candidate_list = max(data.items(), key=lambda x: len(x[1]))
-    table = _make_table(data, thing)
-    foldings = collections.defaultdict(lambda: 1)
+    layouts = {key: _ColumnLayout(key, value) for key, value in source_data.items()}
+    width = _table_width(layouts.values())
     buffer = 4  # The table has 4 additional lines
     # In every iteration, fold the currently longest column
     # until the table is small enough or too wide.
-    while table.table_width < term_size.columns and len(candidate_list) + buffer > term_size.lines:
-        foldings[candidate_key] += 1
-        new = _fold_list(source_data[candidate_key], foldings[candidate_key])
-        data_candidate = copy.deepcopy(data)
-        data_candidate[candidate_key] = new
-        table = _make_table(data_candidate, thing)
-        if len(candidate_list) + buffer < term_size.lines or table.table_width > term_size.columns:
+    candidate = max(layouts.values(), key=lambda layout: layout.height)
+    while width < term_size.columns and candidate.height + buffer > term_size.lines and candidate.height:
+        height, candidate_width = _timed("fold step", candidate.fold, candidate.folds + 1)
+        previous = candidate.height, candidate.width
+        candidate.height, candidate.width = height, candidate_width
+        new_width = _table_width(layouts.values())
+        if new_width > term_size.columns:
+            candidate.height, candidate.width = previous
             break
-        data = data_candidate
-        candidate_key, candidate_list = max(data.items(), key=lambda x: len(x[1]))
-    return data
+        candidate.folds += 1
+        width = new_width
+        candidate = max(layouts.values(), key=lambda layout: layout.height)
+    data = {key: _fold_list(source_data[key], layout.folds, layout.widths) if layout.folds > 1
+            else list(source_data[key]) for key, layout in layouts.items()}
+    return data, {key: layout.width for key, layout in layouts.items()}
+
+
+def _apply_custom_filters(attributes, thing):
+    """Ignore some of the fields if they don't provide good information."""
+    attributes = (attribute for attribute in attributes if attribute.error is None)
+    # PrefixUnits spam the table, as they show the same base units 20 times
+    if type(thing).__name__ == "module" and thing.__name__ == "astropy.units":
+        attributes = (attribute for attribute in attributes if attribute.typename != "PrefixUnit")
+    return list(attributes)
+
+
+def __getattr__(name):
+    """Provide the default TABLETYPE without importing terminaltables on import."""
+    if name == "TABLETYPE":
+        return terminaltables.DoubleTable
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+class _Settings:
+    """Context manager that applies settings to the current context."""
+
+    def __init__(self, overrides):
+        self.overrides = overrides
+        self.tokens = []
+
+    def __enter__(self):
+        current = _SETTINGS.get() or {}
+        self.tokens.append(_SETTINGS.set(dict(current, **self.overrides)))
+        return self
+
+    def __exit__(self, *exc_info):
+        _SETTINGS.reset(self.tokens.pop())
+
+
+def settings(**overrides):
+    """Change tabletype, colorize or renderer for the current thread or task.
 
+    The settings replace TABLETYPE, COLORIZE and RENDERER inside the with
+    block, without affecting explorations in other threads or tasks:
 
-def _set_table_title(thing, table):
-    """Infer the title of the table from the object type."""
+        with explor.settings(colorize=False, tabletype=explor.terminaltables.AsciiTable):
+            explor.explore(thing)
+    """
+    unknown = set(overrides).difference(("tabletype", "colorize", "renderer"))
+    if unknown:
+        raise TypeError("Unknown settings: {}".format(", ".join(sorted(unknown))))
+    return _Settings({key.upper(): value for key, value in overrides.items()})
+
+
+def _setting(name):
+    """Return a setting of the current context, or the module global of the same name."""
+    overrides = _SETTINGS.get()
+    if overrides and name in overrides:
+        return overrides[name]
+    return globals().get(name)
+
+
+class Profile:
+    """Time spent in the stages of explorations, recorded by profile().
+
+    stages maps the name of every stage to its number of calls and its total
+    time in seconds. attributes holds a (seconds, owner, name) tuple for every
+    attribute that was read.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.attributes = []
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(_PROFILE.set(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        _PROFILE.reset(self._tokens.pop())
+
+    def add(self, stage, elapsed):
+        """Record a call of a stage that took elapsed seconds."""
+        calls, total = self.stages.get(stage, (0, 0.0))
+        self.stages[stage] = (calls + 1, total + elapsed)
+
+    def slowest(self, count=10):
+        """Return the count attributes that took the longest to read, slowest first."""
+        return sorted(self.attributes, key=lambda attribute: attribute[0], reverse=True)[:count]
+
+    def report(self, count=10) -> str:
+        """Return the stages and the slowest attributes as text."""
+        lines = ["{:24}{:>8}{:>12}".format("stage", "calls", "time [ms]")]
+        for stage, (calls, total) in sorted(self.stages.items(), key=lambda item: item[1][1], reverse=True):
+            lines.append("{:24}{:8d}{:12.3f}".format(stage, calls, total * 1000))
+        if self.attributes:
+            lines.append("")
+            lines.append("{:44}{:>12}".format("slowest attributes", "time [ms]"))
+            for elapsed, owner, name in self.slowest(count):
+                lines.append("{:44}{:12.3f}".format("{}.{}".format(owner, name), elapsed * 1000))
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
+
+
+def profile() -> Profile:
+    """Record where explorations in the current thread or task spend their time.
+
+    The stages of explore, from dir() to writing the table, are timed and
+    counted, and the access time of every attribute is kept:
+
+        with explor.profile() as stats:
+            explor.explore(thing)
+        print(stats.report())
+    """
+    return Profile()
+
+
+def _timed(stage, function, *args, **kwargs):
+    """Call function, and record the time it took as stage if a profile is active."""
+    current = _PROFILE.get()
+    if current is None:
+        return function(*args, **kwargs)
+    start = time.perf_counter()
     try:
-        table.title = " {}: {} ".format(type(thing).__name__, thing.__name__)
-    except AttributeError:
-        table.title = " Class {} ".format(type(thing).__name__)
+        return function(*args, **kwargs)
+    finally:
+        current.add(stage, time.perf_counter() - start)
 
 
-def _apply_custom_filters(items, thing):
-    """Ignore some of the fields if they don't provide good information."""
-    # PrefixUnits spam the table, as they show the same base units 20 times
-    items = (item for item in items
-             if not (type(thing).__name__ == "module"
-                     and thing.__name__ == "astropy.units"
-                     and type(getattr(thing, item)).__name__ == "PrefixUnit"))
-    return set(items)
+def _table_type():
+    """Return the configured table type."""
+    return _setting("TABLETYPE") or terminaltables.DoubleTable
+
+
+def _initialize():
+    """Wrap stdout with colorama once something gets explored."""
+    global _INITIALIZED  # pylint: disable=global-statement
+    if not _INITIALIZED:
+        colorama.init()
+        _INITIALIZED = True
 
 
 def colored(data: str, color: str) -> str:
     """Color a string with colorama and reset if allowed to do so."""
-    if COLORIZE:
-        return "{color}{data}{reset}".format(color=color, data=data,
-                                             reset=colorama.Style.RESET_ALL)
+    if _setting("COLORIZE"):
+        return _Cell("{color}{data}{reset}".format(color=color, data=data, reset=colorama.Style.RESET_ALL),
+                     _display_width(data))
     else:
         return data
 
 
-def docstring_head(thing):
-    """Extract the head of a doc string."""
-    doc = pydoc.getdoc(thing)
+def _data_cell(item, typename, color):
+    """Format a data member as "name: type", with a colored type."""
+    text = colored(typename, color)
+    return _Cell("{}: {}".format(item, text), _display_width(item) + 2 + _display_width(text))
+
+
+def docstring_head(thing, static=False):
+    """Extract the head of a doc string.
+
+    If static is True, __doc__ is looked up without evaluating descriptors.
+    """
+    if static:
+        doc = inspect.getattr_static(thing, "__doc__", None)
+        doc = inspect.cleandoc(doc) if isinstance(doc, str) else ""
+    else:
+        doc = pydoc.getdoc(thing)
+    return _docstring_head(doc)
+
+
+def _docstring_head(doc):
+    """Shorten a doc string to its first paragraph or its first lines."""
     if len(doc.splitlines()) < 10:
         # docstring is short enough
         return doc
@@ -408,62 +1538,918 @@ def docstring_head(thing):
             return "\n".join(doc.splitlines()[:10]) + "\n..."
 
 
-def explore_signature(thing: object, show_hidden: bool = False):
-    """Show information about a function and its parameters as a table."""
-    properties = SignatureProperties(thing, show_hidden)
-    if properties.error:
-        print(properties.error)
+class ModuleIndex:
+    """Persistent on-disk index of module classifications.
+
+    Every module is stored as a single line of JSON in its own file, together
+    with its key: the module name, the package version, the modification
+    time of the module file, and the versions of python and explor. An
+    entry with a different key is outdated and gets replaced.
+    At most max_entries modules are kept, the least recently used are
+    evicted first. If the directory can not be written, nothing is stored.
+    """
+
+    def __init__(self, directory=None, max_entries=64):
+        if directory is None:
+            directory = os.environ.get("EXPLOR_CACHE_DIR") or os.path.join(
+                os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "explor")
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, module):
+        """Return the key of a module, or None if it has no file to check for changes."""
+        filename = getattr(module, "__file__", None)
+        if not filename:
+            return None
+        try:
+            mtime = os.stat(filename).st_mtime_ns
+        except OSError:
+            return None
+        package = sys.modules.get(module.__name__.partition(".")[0], module)
+        version = getattr(module, "__version__", None) or getattr(package, "__version__", None)
+        return {
+            "module": module.__name__,
+            "version": str(version),
+            "mtime": mtime,
+            "python": list(sys.version_info[:2]),
+            "explor": __version__,
+        }
+
+    def _path(self, module):
+        """Return the path of the entry of a module."""
+        return os.path.join(self.directory, module.__name__ + ".jsonl")
+
+    def load(self, module):
+        """Return the stored ObjectInfo of a module, or None if it is missing or outdated."""
+        key = self.key(module)
+        path = self._path(module)
+        info = None
+        try:
+            with open(path, encoding="utf8") as file:
+                entry = json.loads(file.readline())
+            if key is not None and entry["key"] == key:
+                info = ObjectInfo(**{name: tuple(value) if isinstance(value, list) else value
+                                     for name, value in entry["info"].items()})
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, or written by a different version of explor
+            pass
+        if info is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return info
+
+    def store(self, module, info):
+        """Save the ObjectInfo of a module and evict the least recently used entries."""
+        key = self.key(module)
+        if key is None:
+            return
+        entry = {"key": key, "info": {name: getattr(info, name) for name in ObjectInfo._fields}}
+        path = self._path(module)
+        temporary = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary, "w", encoding="utf8") as file:
+                file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            os.replace(temporary, path)
+            self._evict()
+        except OSError:
+            # Read-only, full or not a directory: exploring works without the index
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+
+    def _evict(self):
+        """Remove the least recently used entries above max_entries."""
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if name.endswith(".jsonl")]
+        if len(paths) <= self.max_entries:
+            return
+        paths.sort(key=lambda path: os.stat(path).st_mtime_ns)
+        for path in paths[:len(paths) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".jsonl"):
+                    os.remove(os.path.join(self.directory, name))
+        self.hits = 0
+        self.misses = 0
+
+
+# Set to a ModuleIndex to persist the classification of explored modules
+MODULE_INDEX = None
+
+
+def _resolve_cache(cache):
+    """Translate the cache argument of the public functions to an ObjectCache or None."""
+    if cache is True:
+        return OBJECT_CACHE
+    elif cache is False:
+        return None
+    return cache
+
+
+def inspect_signature(thing: object, show_hidden: bool = False) -> SignatureInfo:
+    """Analyze the parameters of a function without printing anything."""
+    return SignatureInfo.from_properties(SignatureProperties(thing, show_hidden))
+
+
+def inspect_object(thing, cache=False, index=None, budget=None, static=False) -> ObjectInfo:
+    """Classify the members of an object without printing anything.
+
+    With cache=True, the classification is reused from OBJECT_CACHE,
+    another ObjectCache can be passed as well. Modules are also looked up in
+    the ModuleIndex index, which defaults to MODULE_INDEX. With a budget in
+    seconds, properties that take longer are marked as UNEVALUATED, and the
+    index is not used.
+    With static=True, properties, other descriptors and __getattr__ are not
+    evaluated, and neither the cache nor the index are used.
+    """
+    if static:
+        return ObjectInfo.from_properties(ObjectProperties(thing, static=True))
+    if index is None:
+        index = MODULE_INDEX
+    # A budget gives a partial result that depends on timing, it is neither loaded from nor stored in the index
+    if index and budget is None and inspect.ismodule(thing):
+        info = index.load(thing)
+        if info is None:
+            info = ObjectInfo.from_properties(ObjectProperties(thing, cache=_resolve_cache(cache)))
+            if not info.unevaluated:
+                index.store(thing, info)
+        return info
+    return ObjectInfo.from_properties(ObjectProperties(thing, cache=_resolve_cache(cache), budget=budget))
+
+
+def explore_many(things, cache=None):
+    """Classify a batch of objects without printing anything.
+
+    Yields an ObjectInfo for every object, in order. The work that only depends
+    on the type, like dir(), the parent order, the docstring and the operators,
+    is shared between objects of the same type. Without a cache, an unbounded
+    ObjectCache is used for the duration of the batch, which assumes that
+    the classes and modules are not modified during the batch.
+    """
+    if cache is None:
+        cache = ObjectCache(maxsize=None, versioned=False)
+    for thing in things:
+        yield inspect_object(thing, cache=cache)
+
+
+class PackageReport(_Result):
+    """Merged result of explore_package.
+
+    entries holds a (dotted name, ObjectInfo, SignatureInfo) tuple for every
+    module, class and function, sorted by name. Modules have no SignatureInfo
+    and functions no ObjectInfo. errors holds (dotted name, message) tuples
+    for everything that could not be imported or inspected.
+    """
+
+    __slots__ = ("name", "entries", "errors")
+    _fields = __slots__
+
+
+def _explore_modules(modules):
+    """Import and inspect the modules, and the classes and functions defined in them.
+
+    modules is a list of (module name, names of its submodules). The
+    submodules are imported first, so that a package has the same members no
+    matter which worker inspects it. This runs in the worker processes of
+    explore_package.
+    """
+    entries = []
+    errors = []
+    for name, submodules in modules:
+        for submodule in submodules:
+            try:
+                importlib.import_module(submodule)
+            except (Exception, SystemExit):  # pylint: disable=broad-except
+                pass  # Reported when the submodule itself is inspected
+        try:
+            module = importlib.import_module(name)
+            info = inspect_object(module)
+        except (Exception, SystemExit) as ex:  # pylint: disable=broad-except
+            errors.append((name, "{}: {}".format(type(ex).__name__, ex)))
+            continue
+        entries.append((name, info, None))
+        for member_name in info.classes + info.functions:
+            member = getattr(module, member_name)
+            if getattr(member, "__module__", None) != name:
+                # Imported from somewhere else
+                continue
+            dotted_name = "{}.{}".format(name, member_name)
+            try:
+                object_info = inspect_object(member) if inspect.isclass(member) else None
+                signature_info = inspect_signature(member)
+            except Exception as ex:  # pylint: disable=broad-except
+                errors.append((dotted_name, "{}: {}".format(type(ex).__name__, ex)))
+                continue
+            entries.append((dotted_name, object_info, signature_info))
+    return entries, errors
+
+
+def explore_package(name, workers=None):
+    """Inspect every module of a package, and the classes and functions defined in them.
+
+    The submodules are found with pkgutil.walk_packages and split into slices
+    that are imported and inspected by a pool of worker processes. workers
+    defaults to the number of CPUs, with 0 or 1 everything runs in this
+    process. Returns a PackageReport, which doesn't depend on the number of
+    workers.
+    """
+    errors = []
+    package = importlib.import_module(name)
+    names = [name]
+    if hasattr(package, "__path__"):
+        names.extend(module.name for module in pkgutil.walk_packages(
+            package.__path__, name + ".", onerror=lambda failed: errors.append((failed, "Couldn't walk package"))))
+    submodules = collections.defaultdict(list)
+    for module_name in names[1:]:
+        submodules[module_name.rpartition(".")[0]].append(module_name)
+    modules = [(module_name, submodules[module_name]) for module_name in names]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        results = [_explore_modules(modules)]
+    else:
+        # Several slices per worker, so that a slow slice doesn't stall the pool
+        size = max(1, -(-len(modules) // (workers * 4)))
+        slices = [modules[start:start + size] for start in range(0, len(modules), size)]
+        with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_explore_modules, slices))
+    entries = []
+    for slice_entries, slice_errors in results:
+        entries.extend(slice_entries)
+        errors.extend(slice_errors)
+    return PackageReport(name=name, entries=tuple(sorted(entries, key=lambda entry: entry[0])),
+                         errors=tuple(sorted(set(errors))))
+
+
+class TreeNode(_Result):
+    """Node of explore_tree.
+
+    path is the dotted name of the object, starting with the name of the
+    root, depth the number of attributes between the root and the object and
+    info the ObjectInfo of the object.
+    """
+
+    __slots__ = ("path", "depth", "info")
+    _fields = __slots__
+
+
+# Values that have nothing worth exploring below them
+_TREE_LEAVES = (int, float, complex, str, bytes, bool, type(None))
+
+
+def _tree_scope(thing):
+    """Return the name of the top level package that thing belongs to."""
+    if isinstance(thing, type(sys)):
+        name = thing.__name__
+    elif isinstance(thing, type):
+        name = thing.__module__
+    else:
+        name = type(thing).__module__
+    return str(name).partition(".")[0]
+
+
+def _member_value(thing, item, budget, static):
+    """Get an attribute in the budget or static mode, raise AttributeError if it is not read."""
+    if static and not _is_static(thing, item):
+        raise AttributeError(item)
+    if budget is not None and not _is_static(thing, item):
+        try:
+            return _guarded_getattr(thing, item, budget)
+        except _Unevaluated as ex:
+            raise AttributeError(item) from ex
+    return getattr(thing, item)
+
+
+def explore_tree(thing, max_depth=2, max_nodes=1000, timeout=None, budget=None, static=False, cache=None,
+                 external=False):
+    """Explore the modules, classes and data members below thing breadth-first.
+
+    Yields a TreeNode for every object, starting with thing itself at depth
+    0. Every object is visited once, even if it can be reached in several
+    ways, so cyclic imports end. The walk stops below max_depth, after
+    max_nodes objects or once timeout seconds are used up. Objects from other
+    top level packages than thing are skipped, unless external=True. budget
+    and static are passed on to inspect_object, and the classification of
+    each type is shared like in explore_many. Properties and other members
+    that are computed on access are not descended into, so they only run
+    once, for the classification.
+    """
+    if cache is None:
+        cache = ObjectCache(maxsize=None, versioned=False)
+    if static:
+        cache = False
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    name = getattr(thing, "__name__", None) if isinstance(thing, (type, type(sys))) else None
+    scope = _tree_scope(thing)
+    # Keep the visited objects alive, so that their ids are not reused
+    visited = {id(thing): thing}
+    queue = collections.deque([(str(name or type(thing).__name__), 0, thing)])
+    count = 0
+    while queue and count < max_nodes:
+        if deadline is not None and time.perf_counter() > deadline:
+            return
+        path, depth, current = queue.popleft()
+        info = inspect_object(current, cache=cache, budget=budget, static=static)
+        count += 1
+        yield TreeNode(path=path, depth=depth, info=info)
+        if depth >= max_depth:
+            continue
+        unevaluated = set(info.unevaluated)
+        for item in itertools.chain(info.modules, info.classes, info.data):
+            if item in unevaluated or not _is_static(current, item):
+                continue
+            try:
+                child = getattr(current, item)
+            except Exception:  # pylint: disable=broad-except
+                continue
+            if isinstance(child, _TREE_LEAVES) or id(child) in visited:
+                continue
+            if not external and _tree_scope(child) != scope:
+                continue
+            visited[id(child)] = child
+            queue.append(("{}.{}".format(path, item), depth + 1, child))
+
+
+# Columns whose members have a docstring worth searching, see MemberIndex
+_DOCUMENTED_COLUMNS = ("Modules", "Classes", "Functions", "Methods")
+
+
+def _matcher(pattern, fuzzy):
+    """Return a function that returns a sort key for texts that match pattern, and None for the others.
+
+    Strings match as case-insensitive substrings, or with fuzzy=True if all
+    their characters appear in that order, closer ones first. Compiled
+    regular expressions match anywhere in the text.
+    """
+    if pattern is None:
+        return lambda text: ()
+    if isinstance(pattern, str) and not fuzzy:
+        folded = pattern.lower()
+        return lambda text: () if folded in text.lower() else None
+    if isinstance(pattern, str):
+        expression = re.compile(".*?".join(re.escape(char) for char in pattern), re.IGNORECASE)
+
+        def closeness(text):
+            found = expression.search(text)
+            return (found.end() - found.start(), found.start()) if found else None
+        return closeness
+    return lambda text: () if pattern.search(text) else None
+
+
+class MemberIndex:
+    """Searchable index of the members of an object.
+
+    The names and columns are taken from inspect_object once. The docstring
+    heads of modules, classes and functions and the parameter names of
+    callables are collected on the first search that needs them.
+    """
+
+    def __init__(self, thing, info=None, cache=False, budget=None, static=False):
+        if info is None:
+            info = inspect_object(thing, cache=cache, budget=budget, static=static)
+        self.thing = thing
+        self.info = info
+        self.budget = budget
+        self.static = static
+        self.columns = {}
+        for column, names in info.dict.items():
+            if column != "Ops":
+                for name in names:
+                    self.columns.setdefault(name, column)
+        self.names = tuple(sorted(self.columns))
+        self._descriptions = None
+        self._parameters = None
+
+    def _members(self, columns):
+        """Yield the names and values of the members in columns that can be read."""
+        for name in self.names:
+            if self.columns[name] in columns:
+                try:
+                    yield name, _member_value(self.thing, name, self.budget, self.static)
+                except Exception:  # pylint: disable=broad-except
+                    pass
+
+    @property
+    def descriptions(self):
+        """Return the docstring heads of the modules, classes and functions by name.
+
+        Unlike docstring_head, comments above undocumented objects are not
+        searched, which would read the source files.
+        """
+        if self._descriptions is None:
+            self._descriptions = {name: _docstring_head(inspect.getdoc(value) or "")
+                                  for name, value in self._members(_DOCUMENTED_COLUMNS)}
+        return self._descriptions
+
+    @property
+    def parameters(self):
+        """Return the parameter names of the classes and functions by name."""
+        if self._parameters is None:
+            self._parameters = {}
+            for name, value in self._members(("Classes", "Functions", "Methods")):
+                try:
+                    signature = _parse_signature(value).signature
+                except Exception:  # pylint: disable=broad-except
+                    signature = None
+                if signature is not None:
+                    self._parameters[name] = frozenset(signature.parameters)
+        return self._parameters
+
+    def search(self, pattern=None, fuzzy=False, docs=False, parameter=None, columns=None):
+        """Return the names of the members that match, as a tuple.
+
+        pattern is a string or a compiled regular expression, see _matcher,
+        with docs=True the docstring heads are searched as well. parameter
+        only keeps callables with a parameter of that name, and columns
+        the members of these columns, like ("Functions",).
+        The names are sorted, fuzzy matches by closeness. Members that only
+        match by their docstring come after those that match by name.
+        """
+        matches = _matcher(pattern, fuzzy)
+        descriptions = self.descriptions if docs and pattern is not None else {}
+        parameters = self.parameters if parameter is not None else None
+        found = []
+        for name in self.names:
+            if columns is not None and self.columns[name] not in columns:
+                continue
+            if parameters is not None and parameter not in parameters.get(name, ()):
+                continue
+            key = matches(name)
+            if key is not None:
+                found.append(((0,) + key, name))
+            elif name in descriptions:
+                key = matches(descriptions[name])
+                if key is not None:
+                    found.append(((1,) + key, name))
+        return tuple(name for _, name in sorted(found))
+
+    def select(self, pattern=None, fuzzy=False, docs=False, parameter=None, columns=None) -> ObjectInfo:
+        """Return the ObjectInfo with only the members that match, see search."""
+        keep = set(self.search(pattern, fuzzy, docs, parameter, columns))
+        info = self.info
+        fields = {name: getattr(info, name) for name in ObjectInfo._fields}
+        for name in ("dunders", "secrets", "constants", "modules", "methods", "functions", "classes", "extras"):
+            fields[name] = tuple(item for item in fields[name] if item in keep)
+        data = [(item, typename) for item, typename in zip(info.data, info.data_types) if item in keep]
+        fields["data"] = tuple(item for item, _ in data)
+        fields["data_types"] = tuple(typename for _, typename in data)
+        # Operators are no members, they are only kept if they match by themselves
+        matches = _matcher(pattern, fuzzy)
+        fields["ops"] = tuple(text for text in info.ops if pattern is not None and parameter is None
+                              and (columns is None or "Ops" in columns) and matches(text) is not None)
+        return ObjectInfo(subject=info.subject, **fields)
+
+
+def find(thing, pattern=None, fuzzy=False, docs=False, parameter=None, columns=None, budget=None, static=False):
+    """Return the names of the members of thing that match, see MemberIndex.search.
+
+    For example, find(numpy, "fft", docs=True) finds the members that
+    mention fft, and find(numpy, parameter="dtype", columns=("Functions",))
+    the functions that take a dtype. Keep a MemberIndex to search the same
+    object repeatedly.
+    """
+    return MemberIndex(thing, budget=budget, static=static).search(pattern, fuzzy, docs, parameter, columns)
+
+
+class DiffInfo(_Result):
+    """Differences between the members of two objects, as returned by inspect_diff.
+
+    before and after are the titles of the two objects. added and removed
+    hold (name, kind) tuples, moved holds (name, kind before, kind after)
+    tuples and changed (name, signature before, signature after) tuples of
+    callables. The kind of a member is its column, or "Data (typename)" for
+    data members, so a change of the data type counts as a move.
+    """
+
+    __slots__ = ("before", "after", "added", "removed", "moved", "changed")
+    _fields = __slots__
+
+
+def _member_kinds(info):
+    """Map the members and operators of an ObjectInfo to their kinds, see DiffInfo."""
+    kinds = {}
+    for column, names in info.dict.items():
+        if column not in ("Data", "Ops"):
+            kinds.update(dict.fromkeys(names, column))
+    kinds.update(zip(info.data, ("Data ({})".format(typename) for typename in info.data_types)))
+    # Operators are stored apart from the members, their texts could be member names
+    kinds.update(((" " + text, "Ops") for text in info.ops))
+    return kinds
+
+
+def _signature_text(thing, item, budget, static):
+    """Return the signature of a member as text, or None if it has none."""
+    try:
+        value = _member_value(thing, item, budget, static) if item is not None else thing
+        signature = _parse_signature(value).signature
+    except Exception:  # pylint: disable=broad-except
+        return None
+    return str(signature) if signature is not None else None
+
+
+def inspect_diff(before, after, cache=False, budget=None, static=False) -> DiffInfo:
+    """Compare the members of two objects without printing anything.
+
+    Both objects are classified with inspect_object, and the members are
+    compared by name. Either object can also be an ObjectInfo, like one
+    that was stored with an earlier version of a package. The signatures of
+    the classes and functions that are in both are only compared if both
+    objects are given.
+    """
+    things = [None, None]
+    infos = []
+    for position, thing in enumerate((before, after)):
+        if isinstance(thing, ObjectInfo):
+            infos.append(thing)
+        else:
+            things[position] = thing
+            infos.append(inspect_object(thing, cache=cache, budget=budget, static=static))
+    old, new = (_member_kinds(info) for info in infos)
+    common = old.keys() & new.keys()
+    changed = []
+    if None not in things:
+        callables = ("Classes", "Functions", "Methods")
+        candidates = [None] if callable(before) and callable(after) else []
+        candidates.extend(name for name in sorted(common) if old[name] in callables and new[name] in callables)
+        for name in candidates:
+            signatures = [_signature_text(thing, name, budget, static) for thing in things]
+            if signatures[0] != signatures[1]:
+                changed.append((name or infos[1].name or "", signatures[0], signatures[1]))
+
+    def entries(names, kinds):
+        return tuple((name.strip(), kinds[name]) for name in sorted(names))
+    return DiffInfo(
+        before=infos[0].title.strip(),
+        after=infos[1].title.strip(),
+        added=entries(new.keys() - old.keys(), new),
+        removed=entries(old.keys() - new.keys(), old),
+        moved=tuple((name.strip(), old[name], new[name]) for name in sorted(common) if old[name] != new[name]),
+        changed=tuple(changed),
+    )
+
+
+def _print_signature(info, show_hidden, file=None):
+    """Print the result of inspect_signature as a table."""
+    if info.error:
+        message = colored(info.error, colorama.Fore.RED)
+        if info.documentation:
+            message += "\n" + colored("Check the documentation at {} .".format(info.documentation),
+                                      colorama.Fore.RED)
+        print(message, file=file)
         return
+    header = list(info.header)
+    data = [list(row) for row in info.arguments]
     if not show_hidden:
-        properties.prune_arguments()
+        _prune_arguments(header, data)
     # Convert to Table
+    table = _table_type()([header] + data)
+    table.title = info.title
+    if info.description:
+        print("  Description:\n{}".format(info.description), file=file)
+    print(_timed("render", lambda: table.table), file=file)
 
-    table = TABLETYPE([properties.header] + properties.data)
-    _print_signature_result(thing, properties.dict, properties.return_type, table)
 
+def _object_columns(info, show_hidden):
+    """Return the colored cells of the table of an ObjectInfo by column."""
+    data = info.dict
+    data["Ops"] = [colored(text, colorama.Fore.LIGHTGREEN_EX) for text in info.ops]
+    if not show_hidden:
+        data["Secrets"] = []
+        data["Dunders"] = []
+    data["Data"] = []
+    for item, typename in zip(info.data, info.data_types):
+        color = colorama.Fore.LIGHTYELLOW_EX if typename in (UNEVALUATED, UNRESOLVED) else colorama.Fore.LIGHTCYAN_EX
+        data["Data"].append(_data_cell(item, typename, color))
+    return data
 
-def explore_object(thing, show_hidden=False, folding=True):
-    """Show dir(thing) as a table to make it more human-readable."""
-    # data = _extract_members(thing)
-    properties = ObjectProperties(thing)
 
-    # color operators
-    properties.color_operators()
+def _print_object(info, show_hidden, folding, file=None, column_width=None, renderer=None, warnings=None):
+    """Print the result of inspect_object as a table.
 
-    if not show_hidden:
-        properties.secrets = []
-        properties.dunders = []
-    properties.color_types()
-    if folding:
-        minified_data = _minify_data(properties.dict, thing)
+    With a column_width, the table is not folded, so it can be written
+    without looking at all of the data first. The warnings are appended to
+    the warnings list, if one is given, instead of being printed.
+    """
+    if warnings is not None:
+        warnings.extend(info.warnings)
     else:
-        minified_data = properties.dict
+        for warning in info.warnings:
+            print(colored(warning, colorama.Fore.LIGHTRED_EX), file=file)
+    data = _object_columns(info, show_hidden)
+    widths = None
+    if column_width is not None:
+        widths = dict.fromkeys(data, column_width)
+    elif folding:
+        data, widths = _timed("fold", _fold_data, data)
+
+    if info.parents:
+        print("  Inherits: \n{}".format(info.parents), file=file)
+    if info.description:
+        print("  Description:\n{}".format(info.description), file=file)
+    _timed("render", _write_table, data, info.title, file or sys.stdout, widths, cut=column_width is not None,
+           renderer=renderer)
+
+
+def _print_diff(info, show_hidden, file=None):
+    """Print the result of inspect_diff as a table."""
+    rows = []
+    for entries, color, row in ((info.removed, colorama.Fore.RED, lambda name, kind: [name, kind, "---"]),
+                                (info.added, colorama.Fore.GREEN, lambda name, kind: [name, "---", kind]),
+                                (info.moved, colorama.Fore.YELLOW, lambda name, *kinds: [name, *kinds]),
+                                (info.changed, colorama.Fore.CYAN, lambda name, *signatures: [
+                                    name, *("---" if text is None else text for text in signatures)])):
+        for entry in entries:
+            if show_hidden or not entry[0].startswith("_"):
+                cells = row(*entry)
+                rows.append([colored(cells[0], color)] + cells[1:])
+    if not rows:
+        print("  No differences between {} and {}.".format(info.before, info.after), file=file)
+        return
+    table = _table_type()([["Member", "Before", "After"]] + rows)
+    table.title = " {} -> {} ".format(info.before, info.after)
+    print(_timed("render", lambda: table.table), file=file)
+
+
+def explore_diff(before, after, show_hidden=False, cache=False, budget=None, static=False, file=None):
+    """Show the members that were added, removed or moved between two objects, and the changed signatures.
+
+    The objects are compared with inspect_diff, either can also be an
+    ObjectInfo. The table is written to file, which defaults to sys.stdout.
+    """
+    _initialize()
+    _print_diff(inspect_diff(before, after, cache=cache, budget=budget, static=static), show_hidden, file=file)
+
+
+def explore_signature(thing: object, show_hidden: bool = False, file=None):
+    """Show information about a function and its parameters as a table.
+
+    The table is written to file, which defaults to sys.stdout.
+    """
+    _initialize()
+    _print_signature(inspect_signature(thing, show_hidden), show_hidden, file=file)
+
+
+def explore_object(thing, show_hidden=False, folding=True, cache=False, index=None, budget=None, static=False,
+                   file=None, column_width=None, renderer=None, warnings=None, match=None):
+    """Show dir(thing) as a table to make it more human-readable.
+
+    With cache=True, the classification is reused from OBJECT_CACHE,
+    another ObjectCache can be passed as well. Modules are also looked up in
+    the ModuleIndex index, which defaults to MODULE_INDEX. With a budget in
+    seconds, properties that take longer are shown as slow/unevaluated.
+    With static=True, properties are shown as property and lazy attributes
+    of modules and proxies are not loaded.
+    The table is written line by line to file, which defaults to
+    sys.stdout. With a column_width, all columns have that width and the
+    table is not folded, so the first lines are written right away.
+    renderer="fast" draws large tables faster than terminaltables, the
+    default is taken from RENDERER. Warnings about attributes that couldn't
+    be accessed are appended to the warnings list instead of being printed,
+    if one is given. With a match, only the members whose names contain
+    that string or match that compiled regular expression are shown.
+    """
+    _initialize()
+    info = _inspect_matching(thing, match, cache=cache, index=index, budget=budget, static=static)
+    _print_object(info, show_hidden, folding, file=file, column_width=column_width, renderer=renderer,
+                  warnings=warnings)
+
+
+class TablePager:
+    """Pages of the table of an ObjectInfo, drawn one at a time.
+
+    Every column of the table is shown on its own pages, folded into as many
+    columns as fit into width. A page has at most rows lines of members.
+    The cells are colored, measured and split into pages once, drawing a
+    page only folds and draws the members on it. width and rows default to
+    the size of the terminal. The warnings of info are shown above the first
+    page, or appended to the warnings list instead, if one is given.
+    """
+
+    def __init__(self, info, show_hidden=False, rows=None, width=None, renderer=None, warnings=None):
+        term_size = shutil.get_terminal_size((80, 20))
+        # The title, the header and the borders take 4 lines, one more is left for a prompt
+        self.rows = max(1, rows or term_size.lines - 5)
+        available = (width or term_size.columns) - _table_width([_ColumnLayout("", [""])])
+        self.info = info
+        self.renderer = renderer
+        self.page = 0
+        if warnings is not None:
+            warnings.extend(info.warnings)
+            self._warnings = ""
+        else:
+            self._warnings = "".join(colored(warning, colorama.Fore.LIGHTRED_EX) + "\n" for warning in info.warnings)
+        self._columns = {}
+        self.pages = []
+        for category, cells in _object_columns(info, show_hidden).items():
+            if not cells:
+                continue
+            widths = _display_widths(cells)
+            folds = max(1, (available + 1) // (max(widths) + 1))
+            folds = min(folds, -(-len(cells) // self.rows))
+            self._columns[category] = (cells, widths, folds)
+            size = self.rows * folds
+            self.pages.extend((category, start, min(start + size, len(cells)))
+                              for start in range(0, len(cells), size))
+
+    def __len__(self):
+        return len(self.pages)
+
+    @property
+    def categories(self):
+        """Return the columns of the table that have pages, in order."""
+        return list(self._columns)
 
-    if properties.parents:
-        print("  Inherits: \n{}".format(properties.parents))
-    if properties.description:
-        print("  Description:\n{}".format(properties.description))
-    table = _make_table(minified_data, thing)
-    print(table.table)
+    def render(self, page=None) -> str:
+        """Return a page as text, by default the current page, raise IndexError if there is no such page."""
+        page = self.page if page is None else page
+        warnings = self._warnings if page == 0 else ""
+        if not self.pages:
+            return warnings + "  {} has no members to show.\n".format(self.info.title.strip())
+        if not 0 <= page < len(self.pages):
+            raise IndexError("Page {} is out of range, the pages are 0 to {}".format(page, len(self.pages) - 1))
+        category, start, stop = self.pages[page]
+        cells, widths, folds = self._columns[category]
+        if folds > 1:
+            cells = _fold_list(cells[start:stop], folds, widths[start:stop])
+        else:
+            cells = cells[start:stop]
+        # The title is left out by terminaltables if the table is narrower, the header is always shown
+        header = "{} ({}/{})".format(category, page + 1, len(self.pages))
+        stringio = io.StringIO()
+        stringio.write(warnings)
+        _timed("render", _write_table, {header: cells}, self.info.title, stringio, renderer=self.renderer)
+        return stringio.getvalue()
+
+    def go(self, page) -> str:
+        """Move to a page, counted from 0, and return it as text."""
+        if self.pages:
+            self.page = max(0, min(page, len(self.pages) - 1))
+        return self.render()
+
+    def next(self) -> str:
+        """Move to the next page and return it as text."""
+        return self.go(self.page + 1)
+
+    def previous(self) -> str:
+        """Move to the previous page and return it as text."""
+        return self.go(self.page - 1)
+
+    def jump(self, category) -> str:
+        """Move to the first page of a column, like "Functions", and return it as text."""
+        for page, (name, _, _) in enumerate(self.pages):
+            if name.lower() == category.lower():
+                return self.go(page)
+        raise KeyError("No pages for {!r}, the columns are {}".format(category, ", ".join(self.categories)))
+
+    def browse(self, file=None, prompt=input):
+        """Show the pages one at a time from the current one, and read commands until the end or q.
+
+        Enter or n shows the next page, p the previous one, a number the page
+        with that number and a column name its first page.
+        """
+        file = file or sys.stdout
+        file.write(self.render())
+        while True:
+            try:
+                command = prompt("[n]ext, [p]revious, page, column or [q]uit: ").strip()
+            except EOFError:
+                return
+            if command in ("q", "quit"):
+                return
+            if command in ("", "n"):
+                if self.page + 1 >= len(self.pages):
+                    return
+                text = self.next()
+            elif command == "p":
+                text = self.previous()
+            elif command.isdigit():
+                text = self.go(int(command) - 1)
+            else:
+                try:
+                    text = self.jump(command)
+                except KeyError as ex:
+                    text = "  {}\n".format(ex.args[0])
+            file.write(text)
 
 
-def explore(thing, show_hidden=False, folding=True):
+def explore_pages(thing, show_hidden=False, cache=False, index=None, budget=None, static=False, match=None,
+                  rows=None, width=None, renderer=None, warnings=None) -> TablePager:
+    """Return the table of explore_object as a TablePager, to show it a page at a time.
+
+    The options are the same as for explore_object. Call browse() on the
+    pager to page through the table in the terminal:
+
+        explor.explore_pages(numpy).browse()
+    """
+    _initialize()
+    info = _inspect_matching(thing, match, cache=cache, index=index, budget=budget, static=static)
+    return TablePager(info, show_hidden, rows=rows, width=width, renderer=renderer, warnings=warnings)
+
+
+def explore(thing, show_hidden=False, folding=True, cache=False, index=None, budget=None, static=False,
+            file=None, warnings=None, match=None):
     """Show what you can do with an object.
 
     Depending on the with explore_function or explore_object.
     Note that built-in objects or functions might not be matched correctly.
+    The tables are written to file, which defaults to sys.stdout.
+    With a match, only the matching members are shown, see explore_object.
     """
-    if (
+    _initialize()
+    _explore(thing, file, show_hidden, folding, warnings, match,
+             cache=cache, index=index, budget=budget, static=static)
+
+
+def _inspect_matching(thing, match, **options):
+    """Return inspect_object of thing with only the members that match, see MemberIndex.select."""
+    info = inspect_object(thing, **options)
+    if match is not None:
+        info = MemberIndex(thing, info=info).select(match)
+    return info
+
+
+def _explore(thing, file, show_hidden, folding, warnings, match, **options):
+    """Write the tables of explore to file, the options are passed to inspect_object."""
+    if options.get("static"):
+        # isinstance reads __class__, which loads the target of proxies
+        kind = type(thing)
+        is_function = issubclass(kind, (types.FunctionType, types.MethodType, types.BuiltinFunctionType))
+        is_class = issubclass(kind, type)
+    else:
+        is_function = (
             inspect.isfunction(thing) or
             inspect.ismethod(thing) or
             inspect.isbuiltin(thing)  # This can miss, e.g. print, namedtuple
-    ):
-        explore_signature(thing, show_hidden=show_hidden)
-    elif inspect.isclass(thing):
-        explore_object(thing, show_hidden=show_hidden, folding=folding)
-        explore_signature(thing, show_hidden=show_hidden)
+        )
+        is_class = inspect.isclass(thing)
+    if is_function:
+        _print_signature(inspect_signature(thing, show_hidden), show_hidden, file=file)
+    elif is_class:
+        _print_object(_inspect_matching(thing, match, **options), show_hidden, folding, file=file,
+                      warnings=warnings)
+        _print_signature(inspect_signature(thing, show_hidden), show_hidden, file=file)
     else:
-        explore_object(thing, show_hidden=show_hidden, folding=folding)
+        _print_object(_inspect_matching(thing, match, **options), show_hidden, folding, file=file,
+                      warnings=warnings)
+
+
+def render(thing, show_hidden=False, folding=True, cache=False, index=None, budget=None, static=False,
+           warnings=None, match=None) -> str:
+    """Return what explore would print as a string.
+
+    Nothing is written to sys.stdout, and colorama doesn't need to wrap it.
+    """
+    stringio = io.StringIO()
+    _explore(thing, stringio, show_hidden, folding, warnings, match,
+             cache=cache, index=index, budget=budget, static=static)
+    return stringio.getvalue()
+
+
+async def aexplore(thing, show_hidden=False, folding=True, cache=False, index=None, budget=None, static=False,
+                   warnings=None, match=None):
+    """Return what explore would print, without blocking the event loop.
+
+    The object is explored with render in a worker thread of the loop's
+    default executor, so concurrent calls don't mix their output. The
+    settings() of the calling task apply.
+    """
+    def explore_in_context():
+        return render(thing, show_hidden, folding, cache=cache, index=index, budget=budget, static=static,
+                      warnings=warnings, match=match)
+    # Unlike asyncio.to_thread, run_in_executor doesn't pass on the settings
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(None, context.run, explore_in_context)
+
+
+async def ainspect_object(thing, cache=False, index=None, budget=None, static=False) -> ObjectInfo:
+    """Run inspect_object in a worker thread without blocking the event loop, in the context of the caller."""
+    def classify():
+        return inspect_object(thing, cache=cache, index=index, budget=budget, static=static)
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(None, context.run, classify)
+
+
+async def ainspect_signature(thing, show_hidden=False) -> SignatureInfo:
+    """Run inspect_signature in a worker thread without blocking the event loop, in the context of the caller."""
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(None, context.run, inspect_signature, thing,
+                                                            show_hidden)
 
 
 if __name__ == '__main__':
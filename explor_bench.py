@@ -0,0 +1,239 @@
+"""Benchmarks for explor.
+
+Run with ``python explor_bench.py``. The results can be saved as a JSON
+baseline with ``--save baseline.json`` and compared to a later run with
+``--compare baseline.json``.
+"""
+import gc
+import os
+import re
+import sys
+import json
+import time
+import types
+import argparse
+import datetime
+import fractions
+import functools
+import importlib
+import statistics
+import subprocess
+import tracemalloc
+
+import explor
+
+# Importing these directly is what "import explor" used to cost.
+EAGER_IMPORTS = "import pydoc, shutil, typing, inspect, colorama, terminaltables; colorama.init(); import explor"
+
+# Sizes of the synthetic modules that stand in for numpy, if it is not installed
+MODULE_SIZES = (1000, 10000, 50000)
+# Number of parameters of the synthetic wide signatures
+SIGNATURE_SIZES = (10, 100)
+# Time ratio above which a stage counts as a regression when comparing to a baseline,
+# stages that got slower by less than REGRESSION_MINIMUM seconds are considered noise
+REGRESSION_THRESHOLD = 1.25
+REGRESSION_MINIMUM = 0.0005
+
+
+def import_time(statement="import explor", repeat=7):
+    """Measure the median import time of a statement in fresh interpreters, in microseconds.
+
+    The cumulative times of all top level imports reported by -X importtime are summed.
+    """
+    pattern = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S.*)")
+    totals = []
+    for _ in range(repeat):
+        # Run next to this file, so the explor beside it is imported from any working directory
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                                capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        matches = (pattern.match(line) for line in result.stderr.splitlines())
+        totals.append(sum(int(match.group(1)) for match in matches if match))
+    return statistics.median(totals)
+
+
+def bench_import():
+    """Compare the import of explor with an import of all of its dependencies."""
+    lazy = import_time()
+    eager = import_time(EAGER_IMPORTS)
+    print("{:32}{:8.1f} ms".format("import explor:", lazy / 1000))
+    print("{:32}{:8.1f} ms".format("import explor + dependencies:", eager / 1000))
+    print("{:32}{:8.1f} x".format("speedup:", eager / lazy))
+
+
+def synthetic_module(size):
+    """Create a module with size members of all categories."""
+    module = types.ModuleType("synthetic_{}".format(size), "Synthetic module with {} members.".format(size))
+    kinds = (
+        lambda index: index,
+        lambda index: "value {}".format(index),
+        lambda index: types.FunctionType(synthetic_module.__code__, {}, "function_{}".format(index)),
+        lambda index: type("Class{}".format(index), (), {}),
+        lambda index: types.ModuleType("submodule_{}".format(index)),
+    )
+    for index in range(size):
+        name = "member_{}".format(index) if index % 7 else "CONSTANT_{}".format(index)
+        setattr(module, name, kinds[index % len(kinds)](index))
+    return module
+
+
+def wide_function(size):
+    """Create a function with size annotated parameters of all kinds."""
+    quarter = max(size // 4, 1)
+    parameters = ["p{}: int".format(index) for index in range(quarter)] + ["/"]
+    parameters += ["q{}: str = 'default'".format(index) for index in range(quarter)]
+    parameters += ["*args: typing.Tuple[int, ...]"]
+    parameters += ["k{}: typing.Optional[typing.List[int]] = None".format(index) for index in range(size - 2 * quarter)]
+    parameters += ["**kwargs: float"]
+    source = "def wide({}) -> typing.Dict[str, int]:\n    '''Function with {} parameters.'''".format(
+        ", ".join(parameters), size)
+    namespace = {"typing": importlib.import_module("typing")}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["wide"]
+
+
+def cases():
+    """Return the ladder of objects to benchmark, from small to huge."""
+    ladder = [("int", int), ("str", str), ("datetime", datetime.datetime.now()), ("Fraction", fractions.Fraction)]
+    try:
+        ladder.append(("numpy", importlib.import_module("numpy")))
+    except ImportError:
+        ladder.extend(("module {}".format(size), synthetic_module(size)) for size in MODULE_SIZES)
+    ladder.extend(("signature {}".format(size), wide_function(size)) for size in SIGNATURE_SIZES)
+    return ladder
+
+
+def stages(thing):
+    """Return the stages of an exploration of thing as functions without arguments."""
+    if isinstance(thing, types.FunctionType):
+        return {"signature": functools.partial(explor.SignatureProperties, thing, False),
+                "signature cold": functools.partial(_cold_signature, thing)}
+    properties = explor.ObjectProperties(thing)
+    properties.color_types()
+    title = " {} ".format(type(thing).__name__)
+    data, widths = explor._fold_data(properties.dict)  # pylint: disable=protected-access
+    result = {
+        "properties": functools.partial(explor.ObjectProperties, thing),
+        "fold": functools.partial(explor._minify_data, properties.dict),  # pylint: disable=protected-access
+        "table": lambda: explor._make_table(data, title).table,  # pylint: disable=protected-access
+        "write": lambda: explor._write_table(data, title, _Discard(), widths),  # pylint: disable=protected-access
+        "fast": lambda: explor._write_table(data, title, _Discard(), widths,  # pylint: disable=protected-access
+                                            renderer="fast"),
+        "docstring": functools.partial(explor.docstring_head, thing),
+    }
+    if isinstance(thing, type):
+        result["signature"] = functools.partial(explor.SignatureProperties, thing, False)
+        result["signature cold"] = functools.partial(_cold_signature, thing)
+    return result
+
+
+def _cold_signature(thing):
+    """Parse the signature of thing with empty signature caches."""
+    if explor._SIGNATURES is not None:  # pylint: disable=protected-access
+        explor._SIGNATURES.clear()  # pylint: disable=protected-access
+    explor._PINNED_SIGNATURES.clear()  # pylint: disable=protected-access
+    return explor.SignatureProperties(thing, False)
+
+
+class _Discard:  # pylint: disable=too-few-public-methods
+    """File that forgets everything written to it."""
+
+    def write(self, text):
+        return len(text)
+
+
+class _CountingGetattr:  # pylint: disable=too-few-public-methods
+    """Replacement for the builtin getattr that counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return getattr(*args)
+
+
+def measure(function, repeat=20, budget=1.0):
+    """Measure the best wall time, the peak memory and the getattr calls of explor in function.
+
+    The function is repeated at most repeat times, and not again once budget seconds are used up.
+    """
+    times = []
+    # Like timeit, keep the garbage collector from adding noise to the times
+    gc.disable()
+    try:
+        while len(times) < repeat and sum(times) < budget:
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    counter = _CountingGetattr()
+    explor.getattr = counter
+    try:
+        function()
+    finally:
+        del explor.getattr
+    return {"time": min(times), "peak": peak, "getattr": counter.calls}
+
+
+def bench_stages():
+    """Measure every stage for every case of the ladder, keyed by "case/stage"."""
+    explor._initialize()  # pylint: disable=protected-access
+    results = {}
+    for name, thing in cases():
+        for stage, function in stages(thing).items():
+            results["{}/{}".format(name, stage)] = measure(function)
+    return results
+
+
+def report(results, baseline=None):
+    """Print the results, compared to a baseline if one is given."""
+    print("{:32}{:>12}{:>12}{:>10}{:>10}".format("stage", "time [ms]", "peak [KiB]", "getattr", "ratio"))
+    regressions = []
+    for key, result in results.items():
+        line = "{:32}{:12.3f}{:12.1f}{:10d}".format(key, result["time"] * 1000, result["peak"] / 1024,
+                                                     result["getattr"])
+        if baseline is not None and key in baseline["results"]:
+            before = baseline["results"][key]["time"]
+            ratio = result["time"] / before
+            line += "{:10.2f}".format(ratio)
+            if ratio > REGRESSION_THRESHOLD and result["time"] - before > REGRESSION_MINIMUM:
+                regressions.append(key)
+                line += "  regression"
+        print(line)
+    return regressions
+
+
+def main():
+    """Run all benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", metavar="FILE", help="save the results as JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare the results to a JSON baseline")
+    parser.add_argument("--no-import", action="store_true", help="skip the import time benchmark")
+    args = parser.parse_args()
+    if not args.no_import:
+        bench_import()
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print("Baseline: explor {} on Python {}".format(baseline["explor"], baseline["python"]))
+    results = bench_stages()
+    regressions = report(results, baseline)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({"explor": explor.__version__, "python": sys.version.split()[0], "results": results},
+                      file, indent=1)
+    if regressions:
+        sys.exit("{} regressions above {}x".format(len(regressions), REGRESSION_THRESHOLD))
+
+
+if __name__ == "__main__":
+    main()
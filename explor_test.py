@@ -1,8 +1,21 @@
+import os
 import re
 import sys
+import time
 import unittest
+import threading
+import subprocess
 
 import io
+import datetime
+import json
+import inspect
+import asyncio
+import pickle
+import tempfile
+import contextvars
+import importlib
+import fractions
 import contextlib
 
 import explor
@@ -181,6 +194,621 @@ Kinds of arguments.
 '''
         self.assertEqual(output, raw)
 
+    def test_attribute_resolved_once(self):
+        """Every attribute is looked up a single time, even if it is used in several stages."""
+        calls = []
+
+        class Expensive:
+            @property
+            def value(self):
+                calls.append(1)
+                return 1
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            explor.explore(Expensive())
+        self.assertEqual(len(calls), 1)
+
+    def test_object_cache(self):
+        """Type-level classification is reused, instance data is resolved again."""
+        class Row:
+            def method(self):
+                pass
+
+        first, second = Row(), Row()
+        first.value = 1
+        second.value = "text"
+        cache = explor.ObjectCache(maxsize=1)
+        explor.ObjectProperties(first, cache=cache)
+        properties = explor.ObjectProperties(second, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(properties.methods, ["method"])
+        properties.color_types()
+        self.assertEqual(properties.data, ["value: str"])
+        explor.ObjectProperties(Row, cache=cache)
+        self.assertEqual(len(cache), 1)
+        cache.invalidate(Row)
+        self.assertEqual(len(cache), 0)
+        for number in range(50):
+            explor.ObjectProperties(type("Row", (), {"__op{}__".format(number): None}), cache=cache)
+        self.assertEqual(len(cache._operators), 1)  # pylint: disable=protected-access
+        explor.ObjectProperties(first, cache=cache)
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_object_cache_property(self):
+        """Properties are classified per instance, also if the type is cached."""
+        class Wrapper:
+            def __init__(self, value):
+                self._value = value
+
+            @property
+            def value(self):
+                return self._value
+
+        cache = explor.ObjectCache()
+        self.assertEqual(explor.inspect_object(Wrapper(re), cache=cache).modules, ("value",))
+        info = explor.inspect_object(Wrapper(5), cache=cache)
+        self.assertEqual((info.modules, info.data, info.data_types), ((), ("value",), ("int",)))
+        self.assertEqual(cache.hits, 1)
+        infos = list(explor.explore_many([Wrapper(re), Wrapper(5)]))
+        self.assertEqual([info.modules for info in infos], [("value",), ()])
+
+    def test_object_cache_docstring(self):
+        """Instances that have their own docstring don't share it through the cache."""
+        def first():
+            """Doc of first."""
+
+        def second():
+            """Doc of second."""
+        infos = list(explor.explore_many([first, second, property(doc="Doc of one."), property(doc="Doc of two.")]))
+        self.assertEqual([info.description for info in infos],
+                         ["Doc of first.", "Doc of second.", "Doc of one.", "Doc of two."])
+        cache = explor.ObjectCache()
+        explor.inspect_object(explor.ObjectCache(), cache=cache)
+        self.assertEqual(explor.inspect_object(explor.ObjectCache(), cache=cache).description,
+                         explor.docstring_head(explor.ObjectCache()))
+        self.assertEqual(cache.hits, 1)
+
+    def test_object_cache_output(self):
+        """Cached exploration prints the same table."""
+        outputs = []
+        for cache in (False, True, True):
+            stringio = io.StringIO()
+            with contextlib.redirect_stdout(stringio):
+                explor.explore(re, cache=cache)
+            outputs.append(stringio.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(outputs[0], outputs[2])
+
+    def test_lazy_import(self):
+        """Importing explor neither imports the heavy dependencies nor wraps stdout."""
+        code = ("import sys; stdout = sys.stdout; import explor; "
+                "print(sorted(set(sys.modules) & {'colorama', 'terminaltables', 'pydoc', 'inspect'}), "
+                "sys.stdout is stdout)")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(result.stdout, "[] True\n")
+        # Module attributes are static before anything loaded inspect
+        result = subprocess.run([sys.executable, "-c", "import sys, explor; print(explor._is_static(sys, 'path'))"],
+                                capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(result.stdout, "True\n")
+
+    def test_inspect_object(self):
+        """The structured result holds the classification and is not printed."""
+        stringio = io.StringIO()
+        with contextlib.redirect_stdout(stringio):
+            info = explor.inspect_object(re)
+        self.assertEqual(stringio.getvalue(), "")
+        self.assertIn("compile", info.functions)
+        self.assertEqual(info.modules, ("copyreg", "enum", "functools"))
+        self.assertEqual(info.title, " module: re ")
+        with self.assertRaises(AttributeError):
+            info.functions = ()
+        self.assertEqual(pickle.loads(pickle.dumps(info)), info)
+
+    def test_inspect_signature(self):
+        def a_function(pos: int, /, untyped=4) -> complex:
+            """Kinds of arguments."""
+        info = explor.inspect_signature(a_function)
+        self.assertEqual(info.header, ("Argument", "Default", "Type", "Kind"))
+        self.assertEqual(info.arguments, (("pos", "---", "int", "positional-only"),
+                                          ("untyped", "4", "Any", "positional or keyword")))
+        self.assertEqual(info.title, " Function a_function -> complex ")
+        self.assertIsNone(info.error)
+        info = explor.inspect_signature(max)
+        self.assertEqual(info.error, "<built-in function max> does not reveal its signature.")
+        self.assertEqual(info.documentation, "https://docs.python.org/3/library/functions.html#max")
+
+    def test_explore_many(self):
+        """A batch gives the same results as single explorations."""
+        class Row:
+            def method(self):
+                pass
+
+        rows = [Row() for _ in range(3)]
+        rows[1].value = 1
+        things = rows + [Row, re, Row()]
+        results = explor.explore_many(things)
+        self.assertFalse(isinstance(results, list))
+        self.assertEqual(list(results), [explor.inspect_object(thing) for thing in things])
+
+        class Proxy:
+            """Object that pretends to be its target."""
+
+            def __init__(self, target):
+                self.target = target
+
+            @property
+            def __class__(self):
+                return type(self.target)
+
+        holder = Row()
+        holder.module, holder.number = Proxy(json), Proxy(fractions.Fraction(1))
+        info = explor.inspect_object(holder)
+        self.assertEqual((info.modules, info.data), (("module",), ("number",)))
+
+    def test_explore_package(self):
+        """The report of a package is the same with and without worker processes."""
+        report = explor.explore_package("json", workers=0)
+        names = [entry[0] for entry in report.entries]
+        self.assertEqual(names, sorted(names))
+        self.assertIn("json.decoder.JSONDecoder", names)
+        self.assertIn("tool", report.entries[0][1].modules)
+        self.assertEqual(report, explor.explore_package("json", workers=2))
+
+    def test_module_index(self):
+        """Modules are loaded from the index until their file changes."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "explor_indexed.py")
+            with open(path, "w", encoding="utf8") as file:
+                file.write("def function():\n    pass\n")
+            sys.path.insert(0, directory)
+            try:
+                module = importlib.import_module("explor_indexed")
+            finally:
+                sys.path.remove(directory)
+                del sys.modules["explor_indexed"]
+            index = explor.ModuleIndex(os.path.join(directory, "index"), max_entries=1)
+            info = explor.inspect_object(module, index=index)
+            self.assertEqual(explor.inspect_object(module, index=index), info)
+            self.assertEqual((index.hits, index.misses), (1, 1))
+            explor.inspect_object(module, index=index, budget=1)
+            self.assertEqual((index.hits, index.misses), (1, 1))
+            os.utime(path, ns=(0, 0))
+            explor.inspect_object(module, index=index)
+            self.assertEqual((index.hits, index.misses), (1, 2))
+            explor.inspect_object(re, index=index)
+            self.assertEqual(os.listdir(index.directory), ["re.jsonl"])
+            blocked = explor.ModuleIndex(os.path.join(path, "index"))
+            self.assertEqual(explor.inspect_object(re, index=blocked), explor.inspect_object(re))
+            self.assertIn("compile", explor.render(re, index=blocked))
+
+    def test_budget(self):
+        """Slow properties are skipped instead of blocking."""
+        class Slow:
+            constant = 1
+
+            @property
+            def blocking(self):
+                time.sleep(2)
+
+        start = time.perf_counter()
+        properties = explor.ObjectProperties(Slow(), budget=0.05)
+        self.assertLess(time.perf_counter() - start, 1)
+        properties.color_types()
+        self.assertEqual(properties.data, ["blocking: slow/unevaluated", "constant: int"])
+        self.assertGreaterEqual(properties.timings["blocking"], 0.05)
+        self.assertEqual(explor.inspect_object(Slow(), budget=0.05).unevaluated, ("blocking",))
+
+        class Descriptor:
+            def __get__(self, instance, owner):
+                time.sleep(0.3)
+                return 1
+
+        class SlowClass:
+            slow = Descriptor()
+
+        cache = explor.ObjectCache()
+        self.assertEqual(explor.inspect_object(SlowClass, cache=cache, budget=0.05).unevaluated, ("slow",))
+        self.assertEqual(explor.inspect_object(SlowClass, cache=cache).unevaluated, ())
+        variable = contextvars.ContextVar("test_budget")
+
+        class Contextual:
+            @property
+            def rows(self):
+                return variable.get()
+
+        variable.set([1])
+        self.assertEqual(explor.inspect_object(Contextual(), budget=1).data_types, ("list",))
+
+    def test_static(self):
+        """Static mode doesn't run properties or __getattr__."""
+        loaded = []
+
+        class LazyModule(type(sys)):
+            def __getattr__(self, name):
+                loaded.append(name)
+                raise AttributeError(name)
+
+            def __dir__(self):
+                return super().__dir__() + ["submodule"]
+
+        class Lazy:
+            @property
+            def value(self):
+                loaded.append("value")
+
+            @staticmethod
+            def function():
+                pass
+
+            def method(self):
+                pass
+
+        module = LazyModule("lazy")
+        info = explor.inspect_object(module, static=True)
+        self.assertEqual(info.name, "lazy")
+        self.assertEqual(info.data, ("submodule",))
+        self.assertEqual(info.unevaluated, ("submodule",))
+        info = explor.inspect_object(Lazy(), static=True)
+        self.assertEqual((info.methods, info.functions), (("method",), ("function",)))
+        self.assertEqual(info.data_types, ("property",))
+        self.assertEqual(loaded, [])
+
+        class Proxy:
+            """Proxy that loads its target on first use, like django.utils.functional.LazyObject."""
+
+            def __init__(self):
+                self._wrapped = None
+
+            def _setup(self):
+                loaded.append("setup")
+                self._wrapped = fractions.Fraction(1, 3)
+
+            def __getattr__(self, name):
+                if self._wrapped is None:
+                    self._setup()
+                return getattr(self._wrapped, name)
+
+            def __dir__(self):
+                if self._wrapped is None:
+                    self._setup()
+                return dir(self._wrapped)
+
+            @property
+            def __class__(self):
+                if self._wrapped is None:
+                    self._setup()
+                return self._wrapped.__class__
+
+        info = explor.inspect_object(Proxy(), static=True)
+        self.assertIn("_setup", info.secrets)
+        self.assertIn("_setup", explor.render(Proxy(), show_hidden=True, static=True))
+        self.assertEqual(loaded, [])
+        # Builtin classmethods are classmethod_descriptors, reading them runs no Python code
+        info = explor.inspect_object(datetime.datetime, static=True)
+        self.assertIn("now", info.methods)
+        self.assertNotIn("classmethod_descriptor", info.data_types)
+        self.assertEqual(info.methods, explor.inspect_object(datetime.datetime).methods)
+
+    def test_write_table(self):
+        """The table is written to a file, with the same content as the rendered table."""
+        data = {"Methods": ["first", "second"], "Data": ["x: int"], "Ops": []}
+        stringio = io.StringIO()
+        explor._write_table(data, " Title ", stringio)
+        self.assertEqual(stringio.getvalue(), explor._make_table(data, " Title ").table + "\n")
+
+    def test_column_width(self):
+        """Cells are cut to a fixed column width."""
+        stringio = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            explor.explore_object(fractions.Fraction, file=stringio, column_width=6)
+        self.assertEqual(stdout.getvalue(), "")
+        lines = stringio.getvalue().splitlines()
+        table = lines[lines.index("╔ ABCMeta: Fraction ═══════╦════════╗"):]
+        self.assertEqual(table[1], "║ Metho… ║ Funct… ║ Data   ║ Ops    ║")
+        self.assertEqual(table[3], "║ from_… ║ as_in… ║ denom… ║ !=     ║")
+        self.assertEqual({len(line) for line in table}, {37})
+
+    def test_fast_renderer(self):
+        """The fast renderer draws the same tables as terminaltables."""
+        data = {"Methods": ["first", "second"], "Data": ["x: \033[96mint\033[0m", "日本"], "Ops": ["+"]}
+        self.addCleanup(vars(explor).pop, "TABLETYPE", None)
+        for tabletype in (explor.terminaltables.AsciiTable, explor.terminaltables.DoubleTable,
+                          explor.terminaltables.GithubFlavoredMarkdownTable, explor.terminaltables.PorcelainTable):
+            with self.subTest(tabletype=tabletype.__name__):
+                explor.TABLETYPE = tabletype
+                outputs = []
+                for renderer in ("terminaltables", "fast"):
+                    stringio = io.StringIO()
+                    explor._write_table(data, " Title ", stringio, renderer=renderer)
+                    outputs.append(stringio.getvalue())
+                self.assertEqual(outputs[0], outputs[1])
+        with self.assertRaises(ValueError):
+            explor._write_table(data, " Title ", io.StringIO(), renderer="slow")
+
+    def test_fold_width(self):
+        """Folded cells are aligned by their visible width."""
+        explor.COLORIZE = True
+        try:
+            cells = [explor.colored("red", explor.colorama.Fore.RED), "plain", "日本", "x"]
+        finally:
+            explor.COLORIZE = False
+        folded = explor._fold_list(cells, 2)
+        self.assertEqual([explor._cell_width(cell) for cell in folded], [10, 10])
+        self.assertEqual([explor._display_width(cell) for cell in folded], [10, 10])
+        self.assertEqual(folded[1], "plain x   ")
+        cells = ["a" * (index % 7) for index in range(23)]
+        layout = explor._ColumnLayout("Data", cells)
+        for columns in range(2, 9):
+            folded = explor._fold_list(cells, columns, layout.widths)
+            self.assertEqual(layout.fold(columns), (len(folded), max(cell.width for cell in folded)))
+
+    def test_aexplore(self):
+        """The async variants return what the synchronous functions print."""
+        async def explore_all():
+            return await asyncio.gather(explor.aexplore(re), explor.aexplore(fractions.Fraction),
+                                        explor.ainspect_object(re), explor.ainspect_signature(re.sub))
+
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            module, cls, info, signature = asyncio.run(explore_all())
+        self.assertEqual(stdout.getvalue(), "")
+        for thing, text in ((re, module), (fractions.Fraction, cls)):
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                explor.explore(thing)
+            self.assertEqual(text, stdout.getvalue())
+        self.assertEqual(info, explor.inspect_object(re))
+        self.assertEqual(signature, explor.inspect_signature(re.sub))
+
+        async def profiled():
+            with explor.profile() as stats:
+                await explor.ainspect_object(fractions)
+                await explor.ainspect_signature(re.sub)
+            return stats
+        stats = asyncio.run(profiled())
+        self.assertEqual(stats.stages["dir"][0], 1)
+        self.assertIn("signature", stats.stages)
+
+    def test_settings(self):
+        """Settings only apply to the current thread or task."""
+        def render(colorize, tabletype, results):
+            with explor.settings(colorize=colorize, tabletype=tabletype):
+                for _ in range(20):
+                    stringio = io.StringIO()
+                    explor._print_object(explor.inspect_object(fractions.Fraction), False, True, file=stringio)
+                    results.append(stringio.getvalue())
+
+        plain, colored = [], []
+        threads = [threading.Thread(target=render, args=(False, explor.terminaltables.AsciiTable, plain)),
+                   threading.Thread(target=render, args=(True, explor.terminaltables.DoubleTable, colored))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(plain)), 1)
+        self.assertEqual(len(set(colored)), 1)
+        self.assertNotIn("\033", plain[0])
+        self.assertIn("+", plain[0])
+        self.assertIn("\033", colored[0])
+        self.assertIn("═", colored[0])
+        self.assertFalse(explor.COLORIZE)
+        with explor.settings(colorize=True):
+            self.assertIn("\033", asyncio.run(explor.aexplore(fractions.Fraction)))
+            with explor.settings(renderer="fast"):
+                self.assertEqual(explor._setting("COLORIZE"), True)
+        self.assertNotIn("\033", asyncio.run(explor.aexplore(fractions.Fraction)))
+        with self.assertRaises(TypeError):
+            with explor.settings(color=True):
+                pass
+
+    def test_render(self):
+        """Output goes to the given file or is returned, warnings can be collected."""
+        class Broken:
+            @property
+            def broken(self):
+                raise RuntimeError("broken")
+
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            explor.explore(fractions.Fraction)
+            text = explor.render(fractions.Fraction)
+            stringio = io.StringIO()
+            explor.explore(fractions.Fraction, file=stringio)
+            explor.explore_signature(re.sub, file=stringio)
+            warnings = []
+            explor.explore(Broken(), file=io.StringIO(), warnings=warnings)
+        self.assertEqual(stdout.getvalue(), text)
+        self.assertEqual(stringio.getvalue(), text + explor.render(re.sub))
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("broken", warnings[0])
+        self.assertNotIn("broken", explor.render(Broken(), warnings=[]))
+        self.assertIn("broken", explor.render(Broken()))
+
+    def test_compact_result(self):
+        """Results of the same type share their members and don't keep the object alive."""
+        class Subject:
+            """Weakly referenceable object."""
+
+            def __init__(self, value):
+                self.value = value
+
+        first, second = Subject(1), Subject(2)
+        first_info, second_info = explor.inspect_object(first), explor.inspect_object(second)
+        self.assertIs(first_info.dunders, second_info.dunders)
+        self.assertIs(first_info.description, second_info.description)
+        self.assertIs(first_info.subject, first)
+        del first
+        self.assertIsNone(first_info.subject)
+        self.assertEqual(first_info, second_info)
+        self.assertIs(pickle.loads(pickle.dumps(first_info)).methods, first_info.methods)
+        self.assertIsNone(explor.inspect_object(1).subject)
+        # Free text is shared, but not interned for the rest of the program
+        info = explor.inspect_object(Subject)
+        self.assertEqual(info.description, "Weakly referenceable object.")
+        self.assertIsNot(sys.intern("".join(info.description)), info.description)
+
+    def test_explore_tree(self):
+        """Every object below the root is visited once, within the limits."""
+        package = type(sys)("pkg")
+        package.sub = type(sys)("pkg.sub")
+        package.sub.parent = package
+        package.sub.Thing = type("Thing", (), {"__module__": "pkg.sub", "value": 1})
+        package.sub.thing = package.sub.Thing()
+        package.alias = package.sub.Thing
+        package.outside = fractions
+        nodes = list(explor.explore_tree(package, max_depth=3))
+        self.assertEqual([(node.path, node.depth) for node in nodes],
+                         [("pkg", 0), ("pkg.sub", 1), ("pkg.alias", 1), ("pkg.sub.thing", 2)])
+        self.assertEqual(nodes[1].info.name, "pkg.sub")
+        self.assertEqual(len(list(explor.explore_tree(package, max_depth=1))), 3)
+        self.assertEqual(len(list(explor.explore_tree(package, max_nodes=2))), 2)
+        self.assertIn("pkg.outside", [node.path for node in explor.explore_tree(package, max_depth=1,
+                                                                                 external=True)])
+        calls = []
+
+        def counted(self):
+            calls.append(self)
+            return package.sub.thing
+        package.counted = type("Counted", (), {"__module__": "pkg", "child": property(counted)})()
+        list(explor.explore_tree(package.counted, max_depth=1))
+        self.assertEqual(len(calls), 1)
+
+    def test_signature_cache(self):
+        """Signatures are parsed once per callable, and again after it was modified."""
+        class Subject:
+            """Class with a method."""
+
+            def method(self, value=1):
+                """Method with a default."""
+
+        first, second = Subject().method, Subject().method
+        explor.inspect_signature(first)
+        parsed = explor._parse_signature(second)  # pylint: disable=protected-access
+        self.assertIs(parsed, explor._parse_signature(first))  # pylint: disable=protected-access
+        self.assertEqual(explor.inspect_signature(second).arguments, (("value", "1", "Any", "positional or keyword"),))
+        Subject.method.__defaults__ = (2,)
+        self.assertEqual(explor.inspect_signature(first).arguments, (("value", "2", "Any", "positional or keyword"),))
+        self.assertEqual(len(explor.inspect_signature(Subject.method).arguments), 2)
+        self.assertEqual(explor.inspect_signature(str.upper).arguments[0][0], "self")
+
+        def function(value):
+            """Function with an annotation."""
+        explor.inspect_signature(function)
+        function.__annotations__["value"] = int
+        self.assertEqual(explor.inspect_signature(function).arguments[0][2], "int")
+        function.__signature__ = inspect.Signature([inspect.Parameter("other", inspect.Parameter.KEYWORD_ONLY)])
+        self.assertEqual(explor.inspect_signature(function).arguments[0][0], "other")
+
+    def test_profile(self):
+        """The stages and the attributes are recorded inside the with block only."""
+        class Slow:
+            """Object with a slow property."""
+
+            @property
+            def slow(self):
+                """Take a while."""
+                time.sleep(0.02)
+                return 1
+
+        with explor.profile() as stats:
+            explor.render(Slow())
+        explor.render(Slow())
+        self.assertEqual(stats.stages["access"][0], 1)
+        self.assertEqual(stats.stages["render"][0], 1)
+        self.assertIn("docstring_head", stats.stages)
+        self.assertEqual(stats.slowest(1)[0][1:], ("Slow", "slow"))
+        self.assertGreaterEqual(stats.slowest(1)[0][0], 0.02)
+        self.assertIn("Slow.slow", stats.report())
+
+    def test_member_index(self):
+        """Members are found by name, docstring and parameter, and the table only shows the matches."""
+        index = explor.MemberIndex(fractions)
+        self.assertEqual(index.search("fraction"), ("Fraction",))
+        self.assertEqual(index.search(re.compile("^D")), ("Decimal",))
+        self.assertEqual(index.search("frc", fuzzy=True)[0], "Fraction")
+        self.assertIn("Fraction", index.search("rational number", docs=True))
+        self.assertNotIn("Fraction", index.search("rational number"))
+        self.assertEqual(index.search(parameter="denominator"), ("Fraction",))
+        self.assertEqual(explor.find(fractions, "fraction", columns=("Functions",)), ())
+        info = index.select("fraction")
+        self.assertEqual((info.classes, info.modules, info.dunders, info.ops), (("Fraction",), (), (), ()))
+        table = explor.render(fractions, match="fraction")
+        self.assertIn("Fraction", table)
+        self.assertNotIn("Decimal", table)
+
+    def test_diff(self):
+        """Added, removed and moved members and changed signatures are found."""
+        class Before:
+            """Old version."""
+            value = 1
+            gone = 2
+
+            def method(self, first):
+                """Old signature."""
+
+        class After:
+            """New version."""
+            value = "one"
+
+            def method(self, first, second=2):
+                """New signature."""
+
+            def added(self):
+                """New method."""
+
+        info = explor.inspect_diff(Before, After)
+        self.assertEqual(info.added, (("added", "Functions"),))
+        self.assertEqual(info.removed, (("gone", "Data (int)"),))
+        self.assertEqual(info.moved, (("value", "Data (int)", "Data (str)"),))
+        self.assertEqual(info.changed, (("method", "(self, first)", "(self, first, second=2)"),))
+        stored = explor.inspect_object(Before)
+        self.assertEqual(explor.inspect_diff(stored, After).changed, ())
+        self.assertEqual(explor.inspect_diff(stored, After).added, info.added)
+        stream = io.StringIO()
+        explor.explore_diff(Before, After, file=stream)
+        self.assertIn("(self, first, second=2)", stream.getvalue())
+        stream = io.StringIO()
+        explor.explore_diff(Before, Before, file=stream)
+        self.assertEqual(stream.getvalue(), "  No differences between type: Before and type: Before.\n")
+
+    def test_pager(self):
+        """The pages split the columns, and only the requested page is drawn."""
+        pager = explor.TablePager(explor.inspect_object(fractions), rows=2, width=16)
+        self.assertEqual(pager.categories, ["Modules", "Classes"])
+        self.assertEqual(pager.pages, [("Modules", 0, 2), ("Modules", 2, 4), ("Modules", 4, 5), ("Classes", 0, 2)])
+        self.assertIn("Modules (1/4)", pager.render())
+        self.assertIn("Fraction", pager.jump("classes"))
+        self.assertEqual(pager.page, 3)
+        self.assertIn("Modules (3/4)", pager.previous())
+        self.assertEqual(pager.go(100), pager.render(3))
+        for page in (-1, 4):
+            with self.assertRaises(IndexError):
+                pager.render(page)
+        with self.assertRaises(KeyError):
+            pager.jump("Methods")
+        wide = explor.TablePager(explor.inspect_object(fractions), rows=2, width=40)
+        self.assertEqual(wide.pages[0], ("Modules", 0, 5))
+        pager.go(0)
+        commands = iter(["n", "Classes", "1", "q"])
+        stream = io.StringIO()
+        pager.browse(file=stream, prompt=lambda _: next(commands))
+        self.assertEqual([stream.getvalue().count("({}/4)".format(page)) for page in range(1, 5)], [2, 1, 0, 1])
+        self.assertEqual(pager.page, 0)
+
+        class Broken:
+            """Object with a property that fails."""
+
+            @property
+            def broken(self):
+                """Fail."""
+                raise RuntimeError("broken")
+
+        self.assertIn("broken", explor.explore_pages(Broken()).render(0))
+        warnings = []
+        broken = explor.explore_pages(Broken(), warnings=warnings)
+        self.assertEqual(len(warnings), 1)
+        self.assertNotIn("broken", broken.render(0))
+
 
 if __name__ == '__main__':
     unittest.main()